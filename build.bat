@@ -71,7 +71,7 @@ echo Construindo executavel...
 echo Isso pode demorar alguns minutos...
 echo.
 
-python -m PyInstaller --onefile --windowed --name=PDFExcelUpdater --clean --hidden-import=customtkinter --hidden-import=PIL --hidden-import=PIL._tkinter_finder --hidden-import=pandas --hidden-import=openpyxl --hidden-import=pdfplumber --hidden-import=dotenv --hidden-import=tkinter --hidden-import=tkinter.filedialog --hidden-import=tkinter.messagebox --hidden-import=tkinterdnd2 desktop_app.py
+python -m PyInstaller --onefile --windowed --name=PDFExcelUpdater --clean --hidden-import=customtkinter --hidden-import=PIL --hidden-import=PIL._tkinter_finder --hidden-import=openpyxl --hidden-import=pdfplumber --hidden-import=dotenv --hidden-import=tkinter --hidden-import=tkinter.filedialog --hidden-import=tkinter.messagebox --hidden-import=tkinterdnd2 desktop_app.py
 
 if %errorlevel% neq 0 (
     echo.
@@ -19,22 +19,181 @@ Data: 2025
 """
 
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+import json
 import logging
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterator, List, Optional, Tuple, Callable
 import os
 import shutil
+from functools import lru_cache
 
 # Importações pesadas são carregadas sob demanda
-_pd = None
 _pdfplumber = None
+_pymupdf = None
+_pypdfium2 = None
 _load_workbook = None
+_column_index_from_string = None
 _load_dotenv = None
 
+def _extract_pages_text_range(pdf_path: str, page_indexes: List[int], options: Dict) -> List[str]:
+    """
+    Extrai o texto das páginas page_indexes (base 0) com pdfplumber
+    
+    Função de módulo para poder ser executada em outro processo (ProcessPoolExecutor).
+    Páginas sem texto (ou só com espaços) retornam string vazia para manter o alinhamento com os índices.
+    """
+    import pdfplumber
+
+    texts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = pdf.pages
+        for index in page_indexes:
+            page = pages[index]
+            text = page.extract_text(**options)
+            page.flush_cache()
+            texts.append(text if text and text.strip() else '')
+    return texts
+
+def _pypdfium2_page_text(pdf, index: int) -> str:
+    """Texto de uma página de um PdfDocument do pypdfium2 com quebras de linha \\n ('' se vazia)"""
+    page = pdf[index]
+    textpage = page.get_textpage()
+    try:
+        # PDFium separa linhas com \r\n; o restante do processamento espera \n
+        text = textpage.get_text_range().replace('\r\n', '\n')
+    finally:
+        textpage.close()
+        page.close()
+    return text if text.strip() else ''
+
+def _extract_pages_text_range_pypdfium2(pdf_path: str, page_indexes: List[int]) -> List[str]:
+    """
+    Extrai o texto das páginas page_indexes (base 0) com pypdfium2
+    
+    Cada processo abre o próprio documento: objetos do PDFium não podem ser enviados entre processos.
+    """
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(pdf_path)
+    try:
+        return [_pypdfium2_page_text(pdf, index) for index in page_indexes]
+    finally:
+        pdf.close()
+
+@lru_cache(maxsize=1)
+def _read_env_modelo_dir() -> str:
+    """
+    Lê o .env uma única vez por processo e devolve MODELO_DIR
+    
+    Exceções não são guardadas no cache: após corrigir o .env a próxima chamada lê o arquivo de novo.
+    """
+    global _load_dotenv
+    if _load_dotenv is None:
+        from dotenv import load_dotenv as _ld
+        _load_dotenv = _ld
+
+    if not Path('.env').exists():
+        raise ValueError("Arquivo .env não encontrado. Configure MODELO_DIR no arquivo .env")
+    
+    _load_dotenv()
+    
+    modelo_dir = os.getenv('MODELO_DIR')
+    if not modelo_dir:
+        raise ValueError("MODELO_DIR não está definido no arquivo .env")
+    
+    return modelo_dir
+
 class PDFProcessorCore:
     """Classe central para processamento de PDFs - sem interface gráfica"""
     
+    # Progresso (0-100): as páginas do PDF vão de 0 até este valor; o restante é a atualização do Excel
+    PROGRESS_PAGES_END = 70
+    
+    # Mínimo de páginas por processo para compensar o custo de reabrir o PDF em cada worker
+    MIN_PAGES_PER_WORKER = 4
+    
+    # Assinatura do cabeçalho PDF; leitores aceitam lixo antes dela dentro dos primeiros 1024 bytes
+    PDF_SIGNATURE = b'%PDF-'
+    PDF_SIGNATURE_WINDOW = 1024
+    
+    # Seleção de páginas: "1-3,7,10-12" (numeração a partir de 1)
+    PAGE_SELECTION_PATTERN = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+    
+    # Versão do formato do cache de extração - incrementar ao alterar regras de mapeamento ou o parsing
+    EXTRACTION_CACHE_VERSION = 1
+    # Chaves obrigatórias de uma entrada do cache (mesmas do retorno de _extract_pdf_data)
+    EXTRACTION_CACHE_KEYS = ('person_name', 'total_pages', 'folha_normal_count', 'salario_13_count', 'extracted_data')
+    
+    # Padrões de data de referência, em ordem de prioridade
+    REF_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Referência:\s*(\w+)/(\d{4})',
+        r'Referencia:\s*(\w+)/(\d{4})',
+        r'Data\s*do\s*c[aá]lculo:\s*\d{2}/(\d{2})/(\d{4})',
+        r'Per[ií]odo:\s*(\w+)/(\d{4})',
+        r'Compet[êe]ncia:\s*(\w+)/(\d{4})',
+        r'(\w+)\s*/\s*(\d{4})',
+    ))
+    
+    # Abreviações usadas na coluna A da planilha (índice = número do mês)
+    MESES_ABREV = ('', 'jan', 'fev', 'mar', 'abr', 'mai', 'jun',
+                   'jul', 'ago', 'set', 'out', 'nov', 'dez')
+    
+    # Nome do mês (completo ou abreviado, em minúsculas) -> número do mês
+    MESES_PT = {
+        'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
+        'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
+        'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+    }
+    MESES_ABREV_NUM = {abrev: mes for mes, abrev in enumerate(MESES_ABREV) if abrev}
+    MES_POR_NOME = {**MESES_PT, **MESES_ABREV_NUM}
+    
+    # Bases dos seriais de data do Excel (antes e depois do falso 29/02/1900)
+    EXCEL_EPOCH = datetime(1899, 12, 30)
+    EXCEL_EPOCH_ANTES_MARCO_1900 = datetime(1899, 12, 31)
+    
+    # Números e horas nas linhas de dados
+    NUMBER_PATTERN = re.compile(r'[\d]+(?:[.,:]\d+)*')
+    HOUR_PATTERN = re.compile(r'^\d{1,2}:\d{2}$')
+    
+    # Categorização de páginas
+    # Os grupos estão em ordem de prioridade: o primeiro grupo tem precedência
+    # quando mais de um tipo aparece no mesmo trecho
+    TIPO_FOLHA_PATTERN = re.compile(r'Tipo\s+da\s+folha\s*:', re.IGNORECASE)
+    TIPO_FOLHA_VALUE_PATTERN = re.compile(
+        r'(?P<folha_normal>FOLHA\s+NORMAL)|(?P<salario_13>13\s*SAL[AÁ]RIO)|(?P<ignorar>F[ÉE]RIAS|ADIANTAMENTO|RESCIS[ÃA]O)',
+        re.IGNORECASE
+    )
+    HEADER_TYPE_PATTERN = re.compile(
+        r'(?P<salario_13>13\s*SAL[AÁ]RIO)|(?P<ignorar>F[ÉE]RIAS|ADIANTAMENTO\s*SALARIAL|RESCIS[ÃA]O)',
+        re.IGNORECASE
+    )
+    # Linhas do topo da página usadas como cabeçalho quando não há "Tipo da folha:"
+    HEADER_LINES = 10
+    # Trechos (em minúsculas) que precisam existir para HEADER_TYPE_PATTERN casar
+    HEADER_TYPE_KEYWORDS = ('13', 'férias', 'ferias', 'adiantamento', 'rescis')
+    PAGE_TYPE_BY_GROUP = {
+        'folha_normal': 'FOLHA NORMAL',
+        'salario_13': '13 SALARIO',
+        'ignorar': 'IGNORAR'
+    }
+    
+    # Detecção do nome na primeira página, em ordem de prioridade
+    # (as variantes "Nome"/"NOME" eram redundantes com IGNORECASE)
+    NAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Nome\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+?)(?:\n|$|[A-Z]{2,}:)',
+        r'Nome\s*:\s*(.+?)(?:\n|Endereço|CPF|RG)',
+        r'Nome\s*:\s*(.+?)$',
+    ))
+    # Rótulo "Nome:" dentro de uma linha - todas as NAME_PATTERNS começam por ele
+    NAME_LABEL_PATTERN = re.compile(r'Nome[^\S\n]*:', re.IGNORECASE)
+    NAME_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+    NAME_LETTER_PATTERN = re.compile(r'[A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ]')
+    NAME_EXCLUDED_WORDS = frozenset({'NOME', 'FUNCIONARIO', 'FUNCIONÁRIO', 'TRABALHADOR', 'COLABORADOR', 'EMPREGADO'})
+    
+    # Caracteres inválidos em nomes de arquivo (reservados do Windows e de controle), removidos com str.translate
+    FILENAME_DELETE_TABLE = str.maketrans('', '', '<>:"/\\|?*' + ''.join(map(chr, range(0x20))) + '\x7f')
+    
     def __init__(self, progress_callback: Optional[Callable] = None, log_callback: Optional[Callable] = None):
         """
         Inicializa o processador
@@ -46,6 +205,9 @@ class PDFProcessorCore:
         self.progress_callback = progress_callback
         self.log_callback = log_callback
         
+        # Envia mensagens DEBUG ao log_callback (a CLI desativa fora do modo verboso)
+        self.debug_logging = True
+        
         # Regras de mapeamento para colunas específicas do Excel - ATUALIZADAS v3.2.2
         self.mapping_rules = {
             # FOLHA NORMAL - Obter da coluna ÍNDICE (com fallback especial para PRODUÇÃO)
@@ -74,33 +236,81 @@ class PDFProcessorCore:
             'Y': ['01007301', '01007302']   # HORAS EXT.100%-180 - ambos vão para coluna Y
         }
         
+        # Códigos originais por tipo de folha - usados para descartar rapidamente páginas sem dados
+        self.codes_by_folha_type = {}
+        # Regras por tipo de folha, na ordem de mapping_rules: [(codigo_original, regra)]
+        self.rules_by_folha_type = {}
+        # Mesmas regras agrupadas pelo código: {tipo_folha: {codigo_original: [(codigo_original, regra)]}}
+        self.rules_by_code = {}
+        for rule_key, rule in self.mapping_rules.items():
+            codes = self.codes_by_folha_type.setdefault(rule['folha_type'], [])
+            original_code = rule.get('original_code', rule_key)
+            if original_code not in codes:
+                codes.append(original_code)
+            self.rules_by_folha_type.setdefault(rule['folha_type'], []).append((original_code, rule))
+            self.rules_by_code.setdefault(rule['folha_type'], {}).setdefault(original_code, []).append((original_code, rule))
+        
+        # Uma alternação por tipo de folha localiza todos os códigos da linha em uma única varredura
+        self.code_patterns = {
+            folha_type: re.compile('|'.join(re.escape(code) for code in codes))
+            for folha_type, codes in self.codes_by_folha_type.items()
+        }
+        # Linhas mais curtas que o menor código não podem conter dados
+        self.min_code_length = min(len(code) for codes in self.codes_by_folha_type.values() for code in codes)
+        
+        # Letra da coluna do Excel -> índice numérico (preenchido no primeiro update_excel_file,
+        # quando o openpyxl já foi carregado)
+        self.column_indexes = None
+        
         # Planilha preferida
         self.preferred_sheet = None
         
+        # Biblioteca de extração de texto: 'pdfplumber' (padrão), 'pymupdf' (mais rápida, opcional)
+        # ou 'pypdfium2' (PDFium, instalada junto com o pdfplumber)
+        self.pdf_backend = 'pdfplumber'
+        
+        # Processos para extrair páginas em paralelo com pdfplumber ou pypdfium2 (1 = sequencial, None = um por CPU)
+        self.max_page_workers = 1
+        
+        # Rejeita arquivos sem cabeçalho %PDF- antes de qualquer processamento pesado
+        self.check_pdf_signature = True
+        
+        # Índices (base 0) das páginas a extrair; None = todas. Ver parse_page_selection()
+        self.page_selection = None
+        
+        # Reaproveita os dados extraídos de um PDF já processado (DADOS/.cache)
+        self.extraction_cache_enabled = False
+        
+        # Parâmetros repassados a page.extract_text() do pdfplumber (valores padrão da biblioteca).
+        # Podem ser ajustados para layouts específicos, ex: {'x_tolerance': 2, 'y_tolerance': 3}
+        self.text_extraction_options = {'x_tolerance': 3, 'y_tolerance': 3, 'keep_blank_chars': False}
+        
         # Diretório de trabalho
         self.trabalho_dir = None
         
-        # Meses em português para conversão
-        self.meses_pt = {
-            'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
-            'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
-            'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-        }
-        
-        self.meses_abrev = {
-            'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
-            'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12
-        }
+        # Meses em português para conversão (tabelas compartilhadas da classe)
+        self.meses_pt = self.MESES_PT
+        self.meses_abrev = self.MESES_ABREV_NUM
+
+    def _debug_enabled(self) -> bool:
+        """Indica se mensagens DEBUG têm algum destino (callback com debug_logging ou logging)"""
+        return (self.debug_logging and self.log_callback is not None) or logging.getLogger().isEnabledFor(logging.DEBUG)
 
     def _log(self, message: str, level: str = "INFO"):
         """Envia log para callback se disponível"""
+        if level == "DEBUG":
+            # Cada destino tem a própria chave: debug_logging para o callback, nível do logging para o log padrão
+            if self.debug_logging and self.log_callback:
+                self.log_callback(f"[DEBUG] {message}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(message)
+            return
+        
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
         
         # Log padrão também
-        if level == "DEBUG":
-            logging.debug(message)
-        elif level == "WARNING":
+        if level == "WARNING":
             logging.warning(message)
         elif level == "ERROR":
             logging.error(message)
@@ -113,21 +323,9 @@ class PDFProcessorCore:
             self.progress_callback(progress, message)
 
     def load_env_config(self):
-        """Carrega configurações do arquivo .env"""
-        global _load_dotenv
-        if _load_dotenv is None:
-            from dotenv import load_dotenv as _ld
-            _load_dotenv = _ld
-
-        if Path('.env').exists():
-            _load_dotenv()
-            self._log("Arquivo .env carregado", "DEBUG")
-        else:
-            raise ValueError("Arquivo .env não encontrado. Configure MODELO_DIR no arquivo .env")
-        
-        self.trabalho_dir = os.getenv('MODELO_DIR')
-        if not self.trabalho_dir:
-            raise ValueError("MODELO_DIR não está definido no arquivo .env")
+        """Carrega configurações do arquivo .env (lido uma única vez por processo)"""
+        self.trabalho_dir = _read_env_modelo_dir()
+        self._log("Arquivo .env carregado", "DEBUG")
         
         trabalho_dir_path = Path(self.trabalho_dir)
         if not trabalho_dir_path.exists():
@@ -167,9 +365,23 @@ class PDFProcessorCore:
         if not self.trabalho_dir or not os.path.exists(self.trabalho_dir):
             return []
         
-        trabalho_path = Path(self.trabalho_dir)
-        pdf_files = list(trabalho_path.glob("*.pdf"))
-        return [pdf.name for pdf in pdf_files]
+        return list(self._iter_pdf_names_in_trabalho_dir())
+
+    def has_pdf_files_in_trabalho_dir(self) -> bool:
+        """Indica se há algum PDF no diretório de trabalho (para no primeiro encontrado)"""
+        if not self.trabalho_dir or not os.path.exists(self.trabalho_dir):
+            return False
+        
+        return next(self._iter_pdf_names_in_trabalho_dir(), None) is not None
+
+    def _iter_pdf_names_in_trabalho_dir(self) -> Iterator[str]:
+        """Nomes dos arquivos *.pdf do diretório de trabalho, na ordem do sistema de arquivos"""
+        # scandir não cria um Path por entrada; normcase reproduz a comparação do glob
+        # (sem distinção de maiúsculas no Windows, com distinção nos demais sistemas)
+        with os.scandir(self.trabalho_dir) as entries:
+            for entry in entries:
+                if os.path.normcase(entry.name).endswith('.pdf') and entry.is_file():
+                    yield entry.name
 
     def extract_person_name_from_pdf(self, pdf_path: str) -> Optional[str]:
         """Extrai o nome da pessoa da primeira página do PDF"""
@@ -189,58 +401,62 @@ class PDFProcessorCore:
                 if not text:
                     return None
                 
-                # Procura por padrões de nome
-                name_patterns = [
-                    r'Nome\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+?)(?:\n|$|[A-Z]{2,}:)',
-                    r'NOME\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+?)(?:\n|$|[A-Z]{2,}:)',
-                    r'Nome\s*:\s*(.+?)(?:\n|Endereço|CPF|RG)',
-                    r'NOME\s*:\s*(.+?)(?:\n|ENDEREÇO|CPF|RG)',
-                    r'Nome\s*:\s*(.+?)$',
-                    r'NOME\s*:\s*(.+?)$'
-                ]
-                
-                lines = text.split('\n')
-                
-                for line_num, line in enumerate(lines):
-                    line_clean = line.strip()
-                    
-                    for pattern_num, pattern in enumerate(name_patterns):
-                        match = re.search(pattern, line_clean, re.IGNORECASE)
-                        if match:
-                            nome_bruto = match.group(1).strip()
-                            nome_limpo = self.clean_extracted_name(nome_bruto)
-                            
-                            if nome_limpo:
-                                self._log(f"Nome detectado: {nome_limpo}", "DEBUG")
-                                return nome_limpo
-                
-                return None
+                return self.extract_person_name_from_text(text)
                 
         except Exception as e:
             self._log(f"Erro ao extrair nome do PDF: {e}", "ERROR")
             return None
 
+    def extract_person_name_from_text(self, text: str) -> Optional[str]:
+        """Extrai o nome da pessoa do texto de uma página"""
+        # Procura por padrões de nome
+        name_patterns = self.NAME_PATTERNS
+        
+        # Uma única busca pelo rótulo localiza as linhas candidatas; as demais linhas
+        # não passam pelos padrões
+        last_line_start = -1
+        for label in self.NAME_LABEL_PATTERN.finditer(text):
+            line_start = text.rfind('\n', 0, label.start()) + 1
+            if line_start == last_line_start:
+                continue
+            last_line_start = line_start
+            
+            line_end = text.find('\n', label.end())
+            line_clean = text[line_start:line_end if line_end >= 0 else len(text)].strip()
+            
+            for pattern in name_patterns:
+                match = pattern.search(line_clean)
+                if match:
+                    nome_bruto = match.group(1).strip()
+                    nome_limpo = self.clean_extracted_name(nome_bruto)
+                    
+                    if nome_limpo:
+                        # Chamado a cada página: só monta a mensagem se algum destino aceita DEBUG
+                        if self._debug_enabled():
+                            self._log(f"Nome detectado: {nome_limpo}", "DEBUG")
+                        return nome_limpo
+        
+        return None
+
     def clean_extracted_name(self, nome_bruto: str) -> Optional[str]:
         """Limpa e valida o nome extraído"""
         if not nome_bruto:
             return None
         
-        nome = nome_bruto.strip().upper()
-        nome = re.sub(r'[^\w\s]', ' ', nome)
-        nome = re.sub(r'\s+', ' ', nome).strip()
+        # Um único split separa as palavras e normaliza os espaços
+        palavras = self.NAME_PUNCTUATION_PATTERN.sub(' ', nome_bruto.upper()).split()
+        nome = ' '.join(palavras)
         
         if len(nome) < 3 or len(nome) > 100:
             return None
         
-        if nome.replace(' ', '').isdigit():
+        if ''.join(palavras).isdigit():
             return None
         
-        if not re.search(r'[A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ]', nome):
+        if not self.NAME_LETTER_PATTERN.search(nome):
             return None
         
-        palavras_excluir = ['NOME', 'FUNCIONARIO', 'FUNCIONÁRIO', 'TRABALHADOR', 'COLABORADOR', 'EMPREGADO']
-        palavras = nome.split()
-        palavras_filtradas = [p for p in palavras if p not in palavras_excluir]
+        palavras_filtradas = [p for p in palavras if p not in self.NAME_EXCLUDED_WORDS]
         
         if not palavras_filtradas:
             return None
@@ -254,10 +470,8 @@ class PDFProcessorCore:
 
     def normalize_filename(self, nome: str) -> str:
         """Converte nome da pessoa para formato de arquivo válido mantendo espaços"""
-        filename = nome
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
-        filename = re.sub(r'\s+', ' ', filename).strip()
+        filename = nome.translate(self.FILENAME_DELETE_TABLE)
+        filename = ' '.join(filename.split())
         
         if len(filename) > 100:
             filename = filename[:100].rstrip()
@@ -291,6 +505,16 @@ class PDFProcessorCore:
         
         raise ValueError(f"Arquivo PDF '{pdf_filename}' não encontrado no diretório de trabalho")
 
+    def is_pdf_file(self, pdf_path: str) -> bool:
+        """Verifica pela assinatura %PDF- no início do arquivo se ele é um PDF (sem abrir o parser)"""
+        try:
+            with open(pdf_path, 'rb') as f:
+                header = f.read(self.PDF_SIGNATURE_WINDOW)
+        except OSError:
+            return False
+        
+        return self.PDF_SIGNATURE in header
+
     def copy_modelo_to_dados(self, pdf_path: str, custom_name: Optional[str] = None) -> str:
         """Copia o arquivo modelo para a pasta DADOS"""
         trabalho_dir_path = Path(self.trabalho_dir)
@@ -310,117 +534,289 @@ class PDFProcessorCore:
         destino_file = dados_dir / f"{base_name}.xlsm"
         
         try:
-            shutil.copy2(modelo_file, destino_file)
+            # copyfile já usa a cópia do sistema operacional (sendfile/CopyFile);
+            # os metadados do modelo (copystat do copy2) não interessam à cópia
+            shutil.copyfile(modelo_file, destino_file)
             return str(destino_file)
         except Exception as e:
             raise ValueError(f"Erro ao copiar modelo: {e}")
 
-    def extract_text_from_pdf(self, pdf_path: str) -> List[str]:
-        """Extrai texto de todas as páginas do PDF"""
-        pages_text = []
+    def iter_pages_text(self, pdf_path: str) -> Iterator[str]:
+        """Gera o texto de cada página do PDF usando a biblioteca configurada em pdf_backend"""
+        if self.pdf_backend == 'pymupdf':
+            global _pymupdf
+            if _pymupdf is None:
+                try:
+                    import pymupdf as _pm
+                except ImportError:
+                    try:
+                        import fitz as _pm
+                    except ImportError:
+                        _pm = False
+                _pymupdf = _pm
+            
+            if _pymupdf:
+                yield from self._iter_pages_text_pymupdf(pdf_path)
+                return
+            
+            self._log("PyMuPDF não instalado - usando pdfplumber", "WARNING")
+        elif self.pdf_backend == 'pypdfium2':
+            global _pypdfium2
+            if _pypdfium2 is None:
+                # Só é instalado junto com o pdfplumber a partir da versão 0.10
+                try:
+                    import pypdfium2 as _pdfium
+                except ImportError:
+                    _pdfium = False
+                _pypdfium2 = _pdfium
+            
+            if _pypdfium2:
+                yield from self._iter_pages_text_pypdfium2(pdf_path)
+                return
+            
+            self._log("pypdfium2 não instalado - usando pdfplumber", "WARNING")
+        elif self.pdf_backend != 'pdfplumber':
+            raise ValueError(f"Biblioteca de PDF desconhecida: {self.pdf_backend}")
+        
+        yield from self._iter_pages_text_pdfplumber(pdf_path)
 
-        try:
-            global _pdfplumber
-            if _pdfplumber is None:
-                import pdfplumber as _pp
-                _pdfplumber = _pp
+    def _iter_pages_text_pdfplumber(self, pdf_path: str) -> Iterator[str]:
+        """Extrai o texto página a página com pdfplumber, liberando os objetos da página após a extração"""
+        global _pdfplumber
+        if _pdfplumber is None:
+            import pdfplumber as _pp
+            _pdfplumber = _pp
 
-            with _pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                self._log(f"Processando PDF: {total_pages} páginas")
+        with _pdfplumber.open(pdf_path) as pdf:
+            pages = pdf.pages
+            page_indexes = self._selected_page_indexes(len(pages), "")
+            total_pages = len(page_indexes)
+            
+            workers = self._page_workers(total_pages)
+            if workers > 1:
+                yield from self._iter_pages_text_parallel(pdf_path, page_indexes, workers, _extract_pages_text_range,
+                                                          dict(self.text_extraction_options))
+                return
+            
+            for i, index in enumerate(page_indexes):
+                # Atualiza progresso (0-70%): cada página é extraída e analisada antes da próxima
+                progress = int((i / total_pages) * self.PROGRESS_PAGES_END)
+                self._update_progress(progress, f"Extraindo página {i+1}/{total_pages}")
                 
-                for i, page in enumerate(pdf.pages):
-                    # Atualiza progresso da extração (0-30% do total)
-                    progress = int((i / total_pages) * 30)
-                    self._update_progress(progress, f"Extraindo página {i+1}/{total_pages}")
-                    
-                    text = page.extract_text()
+                page = pages[index]
+                text = page.extract_text(**self.text_extraction_options)
+                # Descarta caracteres e objetos de layout já processados
+                page.flush_cache()
+                
+                # Mesma regra das demais bibliotecas: página só com espaços é página em branco
+                if text and text.strip():
+                    yield text
+
+    def parse_page_selection(self, spec: str) -> List[int]:
+        """
+        Converte uma seleção de páginas como "1-3,7,10-12" (numeração a partir de 1)
+        em índices base 0 ordenados e sem repetição
+        
+        Raises:
+            ValueError: Se a seleção for inválida
+        """
+        page_indexes = set()
+        for part in spec.split(','):
+            match = self.PAGE_SELECTION_PATTERN.fullmatch(part)
+            if not match:
+                raise ValueError(f"Seleção de páginas inválida: {spec}")
+            
+            first = int(match.group(1))
+            last = int(match.group(2)) if match.group(2) else first
+            if first < 1 or last < first:
+                raise ValueError(f"Intervalo de páginas inválido: {part.strip()}")
+            page_indexes.update(range(first - 1, last))
+        
+        return sorted(page_indexes)
+
+    def _selected_page_indexes(self, page_count: int, backend_label: str) -> List[int]:
+        """Índices das páginas a extrair (page_selection limitada ao tamanho do PDF, ou todas)"""
+        if self.page_selection is None:
+            self._log(f"Processando PDF{backend_label}: {page_count} páginas")
+            return list(range(page_count))
+        
+        page_indexes = sorted(index for index in set(self.page_selection) if index < page_count)
+        self._log(f"Processando PDF{backend_label}: {len(page_indexes)} de {page_count} páginas selecionadas")
+        return page_indexes
+
+    def _page_workers(self, total_pages: int) -> int:
+        """Quantidade de processos para extrair total_pages páginas (1 = sequencial)"""
+        max_workers = self.max_page_workers or os.cpu_count() or 1
+        return min(max_workers, total_pages // self.MIN_PAGES_PER_WORKER)
+
+    def _iter_pages_text_parallel(self, pdf_path: str, page_indexes: List[int], workers: int,
+                                  range_extractor: Callable, *extractor_args) -> Iterator[str]:
+        """
+        Distribui faixas contíguas de páginas entre processos, devolvendo o texto na ordem original
+        
+        Args:
+            range_extractor: Função de módulo (pdf_path, índices das páginas, *extractor_args) -> textos das páginas
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        total_pages = len(page_indexes)
+        pages_per_worker = -(-total_pages // workers)
+        self._log(f"Extraindo páginas em paralelo: {workers} processos", "DEBUG")
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(range_extractor, pdf_path, page_indexes[start:start + pages_per_worker],
+                                *extractor_args)
+                for start in range(0, total_pages, pages_per_worker)
+            ]
+            
+            pages_done = 0
+            for future in futures:
+                texts = future.result()
+                pages_done += len(texts)
+                
+                # Atualiza progresso (0-70%): cada página é extraída e analisada antes da próxima
+                progress = int((pages_done / total_pages) * self.PROGRESS_PAGES_END)
+                self._update_progress(progress, f"Extraindo página {pages_done}/{total_pages}")
+                
+                for text in texts:
                     if text:
-                        pages_text.append(text)
-                    
+                        yield text
+
+    def _iter_pages_text_pymupdf(self, pdf_path: str) -> Iterator[str]:
+        """Extrai o texto página a página com PyMuPDF (MuPDF em C)"""
+        with _pymupdf.open(pdf_path) as doc:
+            page_indexes = self._selected_page_indexes(doc.page_count, " (PyMuPDF)")
+            total_pages = len(page_indexes)
+            
+            for i, index in enumerate(page_indexes):
+                # Atualiza progresso (0-70%): cada página é extraída e analisada antes da próxima
+                progress = int((i / total_pages) * self.PROGRESS_PAGES_END)
+                self._update_progress(progress, f"Extraindo página {i+1}/{total_pages}")
+                
+                page = doc.load_page(index)
+                # sort=True ordena os blocos de cima para baixo, como a leitura do pdfplumber
+                text = page.get_text("text", sort=True)
+                if text and text.strip():
+                    yield text
+
+    def _iter_pages_text_pypdfium2(self, pdf_path: str) -> Iterator[str]:
+        """Extrai o texto página a página com pypdfium2 (PDFium em C++)"""
+        pdf = _pypdfium2.PdfDocument(pdf_path)
+        try:
+            page_indexes = self._selected_page_indexes(len(pdf), " (pypdfium2)")
+            total_pages = len(page_indexes)
+            
+            workers = self._page_workers(total_pages)
+            if workers > 1:
+                yield from self._iter_pages_text_parallel(pdf_path, page_indexes, workers,
+                                                          _extract_pages_text_range_pypdfium2)
+                return
+            
+            for i, index in enumerate(page_indexes):
+                # Atualiza progresso (0-70%): cada página é extraída e analisada antes da próxima
+                progress = int((i / total_pages) * self.PROGRESS_PAGES_END)
+                self._update_progress(progress, f"Extraindo página {i+1}/{total_pages}")
+                
+                text = _pypdfium2_page_text(pdf, index)
+                if text:
+                    yield text
+        finally:
+            pdf.close()
+
+    def extract_text_from_pdf(self, pdf_path: str) -> List[str]:
+        """Extrai texto de todas as páginas do PDF"""
+        try:
+            return list(self.iter_pages_text(pdf_path))
         except Exception as e:
             self._log(f"Erro ao processar PDF: {e}", "ERROR")
             raise
+
+    def _parse_reference_month(self, mes_str: str, ano_str: str) -> Optional[Tuple[int, int]]:
+        """Converte o par (mês, ano) capturado em (mês, ano) numéricos, ou None se inválido"""
+        try:
+            mes_str = mes_str.lower()
+            ano = int(ano_str)
             
-        return pages_text
+            mes = self.MES_POR_NOME.get(mes_str)
+            if mes:
+                return (mes, ano)
+            
+            mes = int(mes_str)
+            if 1 <= mes <= 12:
+                return (mes, ano)
+        except ValueError:
+            pass
+        
+        return None
 
     def extract_reference_date(self, text: str) -> Optional[Tuple[int, int]]:
         """Extrai a data de referência da página (mês/ano)"""
-        patterns = [
-            r'Referência:\s*(\w+)/(\d{4})',
-            r'Referencia:\s*(\w+)/(\d{4})',
-            r'Data\s*do\s*c[aá]lculo:\s*\d{2}/(\d{2})/(\d{4})',
-            r'Per[ií]odo:\s*(\w+)/(\d{4})',
-            r'Compet[êe]ncia:\s*(\w+)/(\d{4})',
-            r'(\w+)\s*/\s*(\d{4})',
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    if len(match) == 2:
-                        mes_str = match[0].lower()
-                        ano = int(match[1])
-                        
-                        mes = self.meses_pt.get(mes_str) or self.meses_abrev.get(mes_str)
-                        
-                        if not mes:
-                            try:
-                                mes = int(mes_str)
-                                if 1 <= mes <= 12:
-                                    return (mes, ano)
-                            except ValueError:
-                                continue
-                        else:
-                            return (mes, ano)
-                except ValueError:
-                    continue
+        for pattern in self.REF_DATE_PATTERNS:
+            # finditer é preguiçoso: para na primeira ocorrência válida sem materializar as demais
+            for match in pattern.finditer(text):
+                date_ref = self._parse_reference_month(match.group(1), match.group(2))
+                if date_ref:
+                    return date_ref
         
         return None
 
-    def extract_last_two_numbers(self, line: str):
-        """Extrai os dois últimos números de uma linha"""
-        def convert_to_float_robust(value_str):
-            if not value_str or not value_str.strip():
-                return None
-                
-            cleaned = value_str.strip()
+    def _convert_number(self, value_str: str):
+        """Converte um número do PDF (1.234,56 / 1234.56 / 06:34) em float, ou horas em '06,34'"""
+        if not value_str or not value_str.strip():
+            return None
             
-            # Detecta formato de horas (06:34) e converte para (06,34)
-            if ':' in cleaned:
-                hour_pattern = r'^\d{1,2}:\d{2}$'
-                if re.match(hour_pattern, cleaned):
-                    return cleaned.replace(':', ',')
+        cleaned = value_str.strip()
+        
+        # Detecta formato de horas (06:34) e converte para (06,34)
+        if ':' in cleaned:
+            if self.HOUR_PATTERN.match(cleaned):
+                return cleaned.replace(':', ',')
+            
+            # Os tokens vêm de NUMBER_PATTERN: ':' é o único caractere fora de [\d.,] possível,
+            # então números já limpos dispensam qualquer substituição
+            cleaned = cleaned.replace(':', '')
+        
+        if not cleaned:
+            return None
+        
+        try:
+            # Sem vírgula: inteiro ou decimal com ponto
+            if ',' not in cleaned:
+                return float(cleaned)
             
-            cleaned = re.sub(r'[^\d.,]', '', cleaned)
+            # Uma vírgula: formato brasileiro (1.234,56)
+            if cleaned.count(',') == 1:
+                return float(cleaned.replace('.', '').replace(',', '.'))
             
-            if not cleaned:
-                return None
+            # Várias vírgulas só formam número com exatamente um ponto decimal (1,234,567.89)
+            if cleaned.count('.') == 1:
+                return float(cleaned.replace(',', ''))
             
-            try:
-                if ',' in cleaned and cleaned.count(',') == 1:
-                    return float(cleaned.replace('.', '').replace(',', '.'))
-                elif '.' in cleaned and cleaned.count('.') == 1 and ',' in cleaned:
-                    return float(cleaned.replace(',', ''))
-                elif ',' in cleaned and '.' not in cleaned:
-                    return float(cleaned.replace(',', '.'))
-                elif '.' in cleaned and ',' not in cleaned:
-                    return float(cleaned)
-                else:
-                    return float(cleaned)
-            except ValueError:
-                return None
+            return None
+        except ValueError:
+            return None
+
+    def extract_last_two_numbers(self, line: str):
+        """Extrai os dois últimos números de uma linha"""
+        convert = self._convert_number
         
-        number_pattern = r'[\d]+(?:[.,:]\d+)*'
-        matches = re.findall(number_pattern, line)
+        # Caso comum: as duas últimas palavras da linha já são os números (índice e valor).
+        # Como são separadas por espaço, coincidem com os dois últimos resultados do findall
+        parts = line.rsplit(None, 2)
+        if len(parts) >= 2:
+            number_fullmatch = self.NUMBER_PATTERN.fullmatch
+            if number_fullmatch(parts[-2]) and number_fullmatch(parts[-1]):
+                return convert(parts[-2]), convert(parts[-1])
+        
+        matches = self.NUMBER_PATTERN.findall(line)
         
         if len(matches) >= 2:
-            penultimo = convert_to_float_robust(matches[-2])
-            ultimo = convert_to_float_robust(matches[-1])
+            penultimo = convert(matches[-2])
+            ultimo = convert(matches[-1])
             return penultimo, ultimo
         elif len(matches) == 1:
-            ultimo = convert_to_float_robust(matches[-1])
+            ultimo = convert(matches[-1])
             return None, ultimo
         else:
             return None, None
@@ -431,9 +827,13 @@ class PDFProcessorCore:
         codes_found = []
         attention_info = {}
         
-        relevant_rules = {k: v for k, v in self.mapping_rules.items() if v.get('folha_type') == folha_type}
+        rules_for_folha = self.rules_by_folha_type.get(folha_type, [])
+        rules_by_code = self.rules_by_code.get(folha_type, {})
+        code_pattern = self.code_patterns.get(folha_type)
         
-        lines = text.split('\n')
+        # Tipo de folha sem regras de mapeamento não gera dados
+        if code_pattern is None:
+            return data
         
         # Para 13 SALARIO, fallback especial entre 09090301 e 09090101
         found_09090301 = None
@@ -445,64 +845,76 @@ class PDFProcessorCore:
         # Para detecção geral de duplicidades por descrição
         description_codes = {}  # {descrição: [(codigo, valor, coluna)]}
         
-        for line in lines:
+        min_code_length = self.min_code_length
+        
+        # Linhas curtas demais para conter um código são descartadas antes de qualquer regex
+        for line in text.splitlines():
             line = line.strip()
-            if not line:
+            if len(line) < min_code_length:
                 continue
             
-            for rule_key, rule in relevant_rules.items():
-                original_code = rule.get('original_code', rule_key)
-                
-                if original_code in line:
-                    codes_found.append(original_code)
-                    
-                    indice, valor = self.extract_last_two_numbers(line)
+            matched_codes = {match.group(0) for match in code_pattern.finditer(line)}
+            if not matched_codes:
+                continue
+            
+            # Os números da linha são os mesmos para todos os códigos encontrados nela
+            indice, valor = self.extract_last_two_numbers(line)
+            
+            # Caso comum: um único código na linha vai direto às suas regras. Com mais de um,
+            # as regras são percorridas na ordem de mapping_rules
+            if len(matched_codes) == 1:
+                line_rules = rules_by_code[next(iter(matched_codes))]
+            else:
+                line_rules = [(code, rule) for code, rule in rules_for_folha if code in matched_codes]
+            
+            for original_code, rule in line_rules:
+                codes_found.append(original_code)
                     
-                    if folha_type == '13 SALARIO':
-                        if original_code == '09090301':
-                            found_09090301 = valor
-                        elif original_code == '09090101':
-                            found_09090101 = valor
+                if folha_type == '13 SALARIO':
+                    if original_code == '09090301':
+                        found_09090301 = valor
+                    elif original_code == '09090101':
+                        found_09090101 = valor
                     
-                    # Para códigos específicos com soma (PREMIO PROD + HORAS EXT 100%)
-                    elif original_code in ['01003601', '01003602', '01007301', '01007302']:
-                        value_to_use = None
+                # Para códigos específicos com soma (PREMIO PROD + HORAS EXT 100%)
+                elif original_code in ['01003601', '01003602', '01007301', '01007302']:
+                    value_to_use = None
                         
-                        if rule['source'] == 'indice':
-                            if indice is not None and indice != 0:
-                                value_to_use = indice
-                            elif rule.get('fallback_to_valor', False) and valor is not None:
-                                value_to_use = valor
-                        elif rule['source'] == 'valor' and valor is not None:
+                    if rule['source'] == 'indice':
+                        if indice is not None and indice != 0:
+                            value_to_use = indice
+                        elif rule.get('fallback_to_valor', False) and valor is not None:
                             value_to_use = valor
+                    elif rule['source'] == 'valor' and valor is not None:
+                        value_to_use = valor
                         
-                        if value_to_use is not None:
-                            excel_column = rule['excel_column']
+                    if value_to_use is not None:
+                        excel_column = rule['excel_column']
                             
-                            if excel_column not in sumable_values:
-                                sumable_values[excel_column] = {}
-                            sumable_values[excel_column][original_code] = value_to_use
+                        if excel_column not in sumable_values:
+                            sumable_values[excel_column] = {}
+                        sumable_values[excel_column][original_code] = value_to_use
                     
-                    # Para outros códigos e detecção geral por descrição
-                    elif folha_type == 'FOLHA NORMAL':
-                        value_to_use = None
+                # Para outros códigos e detecção geral por descrição
+                elif folha_type == 'FOLHA NORMAL':
+                    value_to_use = None
                         
-                        if rule['source'] == 'indice':
-                            if indice is not None and indice != 0:
-                                value_to_use = indice
-                            elif rule.get('fallback_to_valor', False) and valor is not None:
-                                value_to_use = valor
-                        elif rule['source'] == 'valor' and valor is not None:
+                    if rule['source'] == 'indice':
+                        if indice is not None and indice != 0:
+                            value_to_use = indice
+                        elif rule.get('fallback_to_valor', False) and valor is not None:
                             value_to_use = valor
+                    elif rule['source'] == 'valor' and valor is not None:
+                        value_to_use = valor
                         
-                        if value_to_use is not None:
-                            data[rule['excel_column']] = value_to_use
+                    if value_to_use is not None:
+                        data[rule['excel_column']] = value_to_use
                             
-                            # Registra para detecção de duplicidade por descrição
-                            description = rule['code']
-                            if description not in description_codes:
-                                description_codes[description] = []
-                            description_codes[description].append((original_code, value_to_use, rule['excel_column']))
+                        # Registra para detecção de duplicidade por descrição
+                        description = rule['code']
+                        if description not in description_codes:
+                            description_codes[description] = []
+                        description_codes[description].append((original_code, value_to_use, rule['excel_column']))
         
         # Processa códigos específicos com soma
         for excel_column, codes_values in sumable_values.items():
@@ -523,7 +935,7 @@ class PDFProcessorCore:
                 # Determina descrição baseada no primeiro código encontrado
                 first_code = codes_found_in_column[0]
                 description = None
-                for rule in relevant_rules.values():
+                for _, rule in rules_for_folha:
                     if rule.get('original_code', rule.get('code')) == first_code:
                         description = rule['code']
                         break
@@ -592,6 +1004,70 @@ class PDFProcessorCore:
         
         return data
 
+    def _match_page_type(self, pattern, text: str) -> Optional[str]:
+        """
+        Identifica o tipo de folha em uma única varredura do texto
+        
+        Respeita a prioridade dos grupos do padrão (o grupo 1 vence os demais),
+        encerrando a busca assim que o tipo de maior prioridade é encontrado.
+        """
+        best_match = None
+        for match in pattern.finditer(text):
+            if best_match is None or match.lastindex < best_match.lastindex:
+                best_match = match
+                if best_match.lastindex == 1:
+                    break
+        
+        if best_match is None:
+            return None
+        return self.PAGE_TYPE_BY_GROUP[best_match.lastgroup]
+
+    def _header_text(self, text: str) -> str:
+        """Cabeçalho da página (HEADER_LINES primeiras linhas), recortado sem separar as linhas"""
+        end = -1
+        for _ in range(self.HEADER_LINES):
+            end = text.find('\n', end + 1)
+            if end < 0:
+                return text
+        return text[:end]
+
+    def categorize_page(self, text: str) -> Optional[str]:
+        """Identifica o tipo da página: 'FOLHA NORMAL', '13 SALARIO', 'IGNORAR' ou None"""
+        page_type = None
+        page_type_found = False
+        
+        # Uma única varredura do texto localiza as linhas com "Tipo da folha:"; sem o
+        # rótulo em nenhum ponto do texto, nenhuma linha pode contê-lo
+        last_line_start = -1
+        for label in self.TIPO_FOLHA_PATTERN.finditer(text):
+            line_start = text.rfind('\n', 0, label.start()) + 1
+            if line_start == last_line_start:
+                continue
+            last_line_start = line_start
+            
+            line_end = text.find('\n', line_start)
+            line_clean = text[line_start:line_end if line_end >= 0 else len(text)].strip()
+            
+            # O rótulo pode ter casado atravessando uma quebra de linha
+            if self.TIPO_FOLHA_PATTERN.search(line_clean):
+                page_type_found = True
+                
+                page_type = self._match_page_type(self.TIPO_FOLHA_VALUE_PATTERN, line_clean)
+                if page_type:
+                    break
+        
+        if not page_type_found:
+            header_text = self._header_text(text)
+            header_lower = header_text.lower()
+            
+            # Sem nenhuma palavra-chave de exclusão o cabeçalho é FOLHA NORMAL - dispensa o regex
+            if any(keyword in header_lower for keyword in self.HEADER_TYPE_KEYWORDS):
+                page_type = self._match_page_type(self.HEADER_TYPE_PATTERN, header_text) or 'FOLHA NORMAL'
+            else:
+                page_type = 'FOLHA NORMAL'
+        
+        return page_type
+
     def filter_and_categorize_pages(self, pages_text: List[str]) -> Dict[str, List[str]]:
         """Filtra e categoriza páginas por tipo"""
         categorized_pages = {
@@ -606,100 +1082,132 @@ class PDFProcessorCore:
             progress = int(30 + (i / total_pages) * 10)
             self._update_progress(progress, f"Categorizando página {i+1}/{total_pages}")
             
-            page_type = None
-            page_type_found = False
-            
-            lines = text.split('\n')
-            for line in lines:
-                line_clean = line.strip()
-                
-                if re.search(r'Tipo\s+da\s+folha\s*:', line_clean, re.IGNORECASE):
-                    page_type_found = True
-                    
-                    if re.search(r'FOLHA\s+NORMAL', line_clean, re.IGNORECASE):
-                        page_type = 'FOLHA NORMAL'
-                        break
-                    elif re.search(r'13\s*SAL[AÁ]RIO', line_clean, re.IGNORECASE):
-                        page_type = '13 SALARIO'
-                        break
-                    elif re.search(r'F[ÉE]RIAS|ADIANTAMENTO|RESCIS[ÃA]O', line_clean, re.IGNORECASE):
-                        page_type = 'IGNORAR'
-                        break
-            
-            if not page_type_found:
-                header_text = '\n'.join(lines[:10])
-                
-                if re.search(r'13\s*SAL[AÁ]RIO', header_text, re.IGNORECASE):
-                    page_type = '13 SALARIO'
-                elif re.search(r'F[ÉE]RIAS|ADIANTAMENTO\s*SALARIAL|RESCIS[ÃA]O', header_text, re.IGNORECASE):
-                    page_type = 'IGNORAR'
-                else:
-                    page_type = 'FOLHA NORMAL'
-            
+            page_type = self.categorize_page(text)
             if page_type and page_type != 'IGNORAR':
                 categorized_pages[page_type].append(text)
                 
         self._log(f"Páginas categorizadas: FOLHA NORMAL={len(categorized_pages['FOLHA NORMAL'])}, 13 SALARIO={len(categorized_pages['13 SALARIO'])}")
         return categorized_pages
 
-    def find_row_for_period(self, worksheet, month: int, year: int, folha_type: str) -> Optional[int]:
-        """Encontra a linha correspondente ao período na planilha"""
-        meses_nomes = ['', 'jan', 'fev', 'mar', 'abr', 'mai', 'jun',
-                      'jul', 'ago', 'set', 'out', 'nov', 'dez']
-        periodo_procurado = f"{meses_nomes[month]}/{str(year)[2:]}"
+    def _format_periodo(self, month: int, year: int) -> str:
+        """Formata o período como na coluna A da planilha (ex: 'jan/20')"""
+        return f"{self.MESES_ABREV[month]}/{str(year)[2:]}"
+
+    def _normalize_period(self, cell_value):
+        """
+        Converte o valor da coluna A em chave de período
         
+        Returns:
+            str com o texto da célula (ex: 'jan/20'), tupla (mês, ano) para datas
+            e seriais do Excel, ou None se o valor não representa um período
+        """
+        if cell_value is None:
+            return None
+        
+        if isinstance(cell_value, str):
+            return cell_value.strip()
+        elif isinstance(cell_value, datetime):
+            return (cell_value.month, cell_value.year)
+        elif isinstance(cell_value, (int, float)):
+            try:
+                if cell_value > 59:
+                    excel_date = self.EXCEL_EPOCH + timedelta(days=cell_value)
+                else:
+                    excel_date = self.EXCEL_EPOCH_ANTES_MARCO_1900 + timedelta(days=cell_value)
+                
+                return (excel_date.month, excel_date.year)
+                
+            except Exception:
+                return None
+        
+        return None
+
+    def _get_period_row_range(self, folha_type: str, max_row: int) -> Optional[Tuple[int, int]]:
+        """Retorna (linha_inicial, linha_final) da seção do tipo de folha na planilha"""
         if folha_type == 'FOLHA NORMAL':
-            start_row = 1
-            end_row = 65
+            return 1, min(65, max_row)
         elif folha_type == '13 SALARIO':
-            start_row = 67
-            end_row = worksheet.max_row
-        else:
+            return 67, max_row
+        return None
+
+    def build_period_index(self, worksheet) -> Dict[str, Dict]:
+        """
+        Indexa a coluna A da planilha em uma única passada
+        
+        Returns:
+            Dict {folha_type: {chave_periodo: linha}} mantendo a primeira linha de cada período
+        """
+        max_row = worksheet.max_row
+        row_ranges = {}
+        for folha_type in ('FOLHA NORMAL', '13 SALARIO'):
+            row_ranges[folha_type] = self._get_period_row_range(folha_type, max_row)
+        
+        period_index = {folha_type: {} for folha_type in row_ranges}
+        
+        column_a = worksheet.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=1, values_only=True)
+        for row_num, (cell_value,) in enumerate(column_a, start=1):
+            key = self._normalize_period(cell_value)
+            if key is None:
+                continue
+            
+            for folha_type, (start_row, end_row) in row_ranges.items():
+                if start_row <= row_num <= end_row:
+                    period_index[folha_type].setdefault(key, row_num)
+        
+        return period_index
+
+    def lookup_period_row(self, period_index: Dict[str, Dict], month: int, year: int, folha_type: str,
+                          periodo: Optional[str] = None) -> Optional[int]:
+        """
+        Busca a linha do período no índice criado por build_period_index
+        
+        Args:
+            periodo: Rótulo 'jan/20' já calculado pelo chamador (opcional)
+        """
+        rows_by_key = period_index.get(folha_type)
+        if rows_by_key is None:
             return None
         
-        for row_num in range(start_row, min(end_row + 1, worksheet.max_row + 1)):
-            cell_value = worksheet[f'A{row_num}'].value
+        periodo_procurado = periodo or self._format_periodo(month, year)
+        
+        # Células texto e células data podem coexistir: vale a primeira linha, como na busca linear
+        candidates = [row for row in (rows_by_key.get(periodo_procurado), rows_by_key.get((month, year))) if row is not None]
+        return min(candidates) if candidates else None
+
+    def find_row_for_period(self, worksheet, month: int, year: int, folha_type: str) -> Optional[int]:
+        """Encontra a linha correspondente ao período na planilha"""
+        # Chaves constantes durante toda a busca
+        periodo_procurado = self._format_periodo(month, year)
+        periodo_data = (month, year)
+        
+        row_range = self._get_period_row_range(folha_type, worksheet.max_row)
+        if row_range is None:
+            return None
+        start_row, end_row = row_range
+        
+        column_a = worksheet.iter_rows(min_row=start_row, max_row=end_row, min_col=1, max_col=1, values_only=True)
+        for row_num, (cell_value,) in enumerate(column_a, start=start_row):
+            key = self._normalize_period(cell_value)
             
-            if cell_value is None:
-                continue
-                
-            if isinstance(cell_value, str):
-                if cell_value.strip() == periodo_procurado:
-                    return row_num
-            elif isinstance(cell_value, datetime):
-                if cell_value.month == month and cell_value.year == year:
-                    return row_num
-            elif isinstance(cell_value, (int, float)):
-                try:
-                    from datetime import timedelta
-                    
-                    if cell_value > 59:
-                        excel_date = datetime(1899, 12, 30) + timedelta(days=cell_value)
-                    else:
-                        excel_date = datetime(1899, 12, 31) + timedelta(days=cell_value)
-                    
-                    if excel_date.month == month and excel_date.year == year:
-                        return row_num
-                        
-                except Exception:
-                    continue
+            if key is not None and (key == periodo_procurado or key == periodo_data):
+                return row_num
         
         return None
 
     def update_excel_file(self, excel_path: str, extracted_data: Dict):
         """Atualiza o arquivo Excel existente com os dados extraídos"""
         try:
-            global _load_workbook
+            global _load_workbook, _column_index_from_string
             if _load_workbook is None:
                 from openpyxl import load_workbook as _lw
                 _load_workbook = _lw
+            if _column_index_from_string is None:
+                from openpyxl.utils import column_index_from_string as _cifs
+                _column_index_from_string = _cifs
 
             is_macro_enabled = excel_path.lower().endswith('.xlsm')
 
-            if is_macro_enabled:
-                workbook = _load_workbook(excel_path, keep_vba=True)
-            else:
-                workbook = _load_workbook(excel_path)
+            workbook = _load_workbook(excel_path, keep_vba=is_macro_enabled)
             
             worksheet = None
             
@@ -722,6 +1230,17 @@ class PDFProcessorCore:
             total_periods = sum(len(periods) for periods in extracted_data.values())
             current_period = 0
             
+            # Coluna A é lida uma única vez; cada período vira uma consulta ao dicionário
+            period_index = self.build_period_index(worksheet)
+            
+            # Letra da coluna -> índice numérico, convertido uma única vez para todas as regras
+            if self.column_indexes is None:
+                self.column_indexes = {
+                    rule['excel_column']: _column_index_from_string(rule['excel_column'])
+                    for rule in self.mapping_rules.values()
+                }
+            column_indexes = self.column_indexes
+            
             for folha_type in ['FOLHA NORMAL', '13 SALARIO']:
                 if folha_type not in extracted_data:
                     continue
@@ -730,13 +1249,11 @@ class PDFProcessorCore:
                     current_period += 1
                     
                     # Atualiza progresso do Excel (70-100% do total)
-                    progress = int(70 + (current_period / total_periods) * 30)
-                    meses = ['', 'jan', 'fev', 'mar', 'abr', 'mai', 'jun',
-                            'jul', 'ago', 'set', 'out', 'nov', 'dez']
-                    periodo = f"{meses[month]}/{str(year)[2:]}"
+                    progress = int(self.PROGRESS_PAGES_END + (current_period / total_periods) * (100 - self.PROGRESS_PAGES_END))
+                    periodo = self._format_periodo(month, year)
                     self._update_progress(progress, f"Atualizando {periodo} ({folha_type})")
                     
-                    row_num = self.find_row_for_period(worksheet, month, year, folha_type)
+                    row_num = self.lookup_period_row(period_index, month, year, folha_type, periodo)
                     
                     if row_num:
                         period_updates = 0
@@ -763,11 +1280,15 @@ class PDFProcessorCore:
                             if column.startswith('_'):  # Ignora metadados
                                 continue
                                 
-                            cell_address = f"{column}{row_num}"
-                            old_value = worksheet[cell_address].value
+                            column_index = column_indexes.get(column)
+                            if column_index is None:
+                                column_index = column_indexes[column] = _column_index_from_string(column)
+                            
+                            cell = worksheet.cell(row=row_num, column=column_index)
+                            old_value = cell.value
                             
                             if old_value is None or old_value == '' or old_value == 0:
-                                worksheet[cell_address] = value
+                                cell.value = value
                                 updates_count += 1
                                 period_updates += 1
                         
@@ -818,6 +1339,170 @@ class PDFProcessorCore:
             self._log(f"Erro ao atualizar Excel: {e}", "ERROR")
             raise
 
+    def _process_page(self, page_text: str) -> Tuple[Optional[str], Optional[Tuple[int, int]], Optional[Dict]]:
+        """
+        Categoriza uma página e extrai seus dados
+        
+        Returns:
+            (tipo da página, data de referência, dados); data e dados ficam None quando
+            a página é ignorada ou não contém nenhum código mapeado
+        """
+        page_type = self.categorize_page(page_text)
+        if page_type not in ('FOLHA NORMAL', '13 SALARIO'):
+            return page_type, None, None
+        
+        # Uma única busca no texto inteiro descarta páginas sem nenhum código mapeado,
+        # antes da data de referência e da varredura linha a linha
+        code_pattern = self.code_patterns.get(page_type)
+        if code_pattern is None or not code_pattern.search(page_text):
+            return page_type, None, None
+        
+        date_ref = self.extract_reference_date(page_text)
+        page_data = self.extract_data_from_page(page_text, page_type) if date_ref else None
+        return page_type, date_ref, page_data
+
+    def _extract_pdf_data(self, pdf_path: str) -> Dict:
+        """
+        Lê todas as páginas do PDF e extrai os dados por tipo de folha
+        
+        Returns:
+            Dict com person_name (detectado na primeira página com texto), total_pages,
+            folha_normal_count, salario_13_count e extracted_data ({tipo_folha: {(mês, ano): dados}})
+        """
+        # Cada página é categorizada e processada assim que sai do PDF: nenhuma lista
+        # intermediária com o texto das páginas é mantida
+        extracted_data = {
+            'FOLHA NORMAL': {},
+            '13 SALARIO': {}
+        }
+        page_counts = dict.fromkeys(extracted_data, 0)
+        total_pages = 0
+        person_name = None
+        
+        # Páginas repetidas (reimpressões) reaproveitam o resultado já calculado. A chave é o
+        # hash do texto com o tamanho (proteção contra colisões), para não manter em memória
+        # o texto das páginas: {(hash, tamanho): resultado}
+        parsed_pages = {}
+        
+        try:
+            for page_text in self.iter_pages_text(pdf_path):
+                total_pages += 1
+                
+                # O nome vem do texto já extraído: o PDF não é aberto uma segunda vez
+                if total_pages == 1:
+                    person_name = self.extract_person_name_from_text(page_text)
+                
+                page_key = (hash(page_text), len(page_text))
+                result = parsed_pages.get(page_key)
+                if result is None:
+                    result = self._process_page(page_text)
+                    if result[1]:
+                        parsed_pages[page_key] = result
+                page_type, date_ref, page_data = result
+                
+                if page_type not in page_counts:
+                    continue
+                page_counts[page_type] += 1
+                
+                if date_ref and page_data:
+                    extracted_data[page_type][date_ref] = page_data
+        except Exception as e:
+            self._log(f"Erro ao processar PDF: {e}", "ERROR")
+            raise
+        
+        self._log(f"Páginas categorizadas: FOLHA NORMAL={page_counts['FOLHA NORMAL']}, 13 SALARIO={page_counts['13 SALARIO']}")
+        
+        return {
+            'person_name': person_name,
+            'total_pages': total_pages,
+            'folha_normal_count': page_counts['FOLHA NORMAL'],
+            'salario_13_count': page_counts['13 SALARIO'],
+            'extracted_data': extracted_data
+        }
+
+    def _extraction_cache_path(self, pdf_path: str) -> Path:
+        """Arquivo de cache do PDF: conteúdo (sha256) + biblioteca de extração + regras de mapeamento e opções de extração"""
+        # hashlib carrega o OpenSSL: só é importado quando o cache está ativo
+        import hashlib
+        
+        # Leitura em blocos de 1 MiB: memória constante mesmo para PDFs grandes
+        pdf_hash = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                pdf_hash.update(chunk)
+        digest = pdf_hash.hexdigest()
+        # As opções de extração alteram o texto lido do PDF: fazem parte da chave junto com as regras
+        settings = {'mapping_rules': self.mapping_rules, 'text_extraction_options': self.text_extraction_options}
+        rules_digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        cache_name = f"{digest}-{self.pdf_backend}-{rules_digest}"
+        if self.page_selection is not None:
+            # Extrações parciais (--pages) não se misturam com a do PDF inteiro
+            pages_key = ','.join(map(str, sorted(set(self.page_selection))))
+            cache_name += f"-p{hashlib.sha256(pages_key.encode('ascii')).hexdigest()[:12]}"
+        cache_name += f"-v{self.EXTRACTION_CACHE_VERSION}.json"
+        return Path(self.trabalho_dir) / "DADOS" / ".cache" / cache_name
+
+    def _load_extraction_cache(self, cache_path: Path) -> Optional[Dict]:
+        """Carrega os dados extraídos do cache, ou None se não houver cache válido"""
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            
+            missing = [key for key in self.EXTRACTION_CACHE_KEYS if key not in cached]
+            if missing:
+                raise ValueError(f"chaves ausentes: {', '.join(missing)}")
+            
+            # JSON não aceita tuplas como chave: períodos são gravados como [mês, ano, dados]
+            cached['extracted_data'] = {
+                folha_type: {(month, year): data for month, year, data in periods}
+                for folha_type, periods in cached['extracted_data'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._log(f"Cache de extração ignorado: {e}", "WARNING")
+            return None
+        
+        self._log("Dados do PDF carregados do cache")
+        return cached
+
+    def _save_extraction_cache(self, cache_path: Path, extraction: Dict):
+        """Grava os dados extraídos no cache (falhas de gravação não interrompem o processamento)"""
+        payload = dict(extraction)
+        payload['extracted_data'] = {
+            folha_type: [[month, year, data] for (month, year), data in periods.items()]
+            for folha_type, periods in extraction['extracted_data'].items()
+        }
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Grava em arquivo temporário e substitui: leitores nunca veem um JSON pela metade
+            temp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self._log(f"Não foi possível gravar o cache de extração: {e}", "WARNING")
+            return
+        
+        self._prune_extraction_cache(cache_path)
+
+    def _prune_extraction_cache(self, cache_path: Path):
+        """Remove entradas antigas do mesmo PDF (outras regras, biblioteca, páginas ou versão do cache)
+        
+        Cada PDF mantém só a entrada mais recente. Entradas de PDFs que foram alterados ou removidos
+        não são identificáveis aqui: apagar a pasta DADOS/.cache é seguro e apenas força nova extração.
+        """
+        pdf_digest = cache_path.name.split('-', 1)[0]
+        for entry in cache_path.parent.glob(f"{pdf_digest}-*.json"):
+            if entry == cache_path:
+                continue
+            try:
+                entry.unlink()
+            except OSError as e:
+                self._log(f"Não foi possível remover cache antigo {entry.name}: {e}", "WARNING")
+
     def process_pdf(self, pdf_filename: str) -> Dict:
         """
         Processa PDF completo
@@ -826,11 +1511,6 @@ class PDFProcessorCore:
             Dict com resultados do processamento
         """
         try:
-            global _pd
-            if _pd is None:
-                import pandas as pd
-                _pd = pd
-
             self._update_progress(0, "Iniciando processamento...")
             
             # Carrega configuração se não foi definida manualmente
@@ -847,73 +1527,53 @@ class PDFProcessorCore:
             
             # Encontra PDF
             pdf_path = self.find_pdf_file(pdf_filename)
-            self._log(f"PDF encontrado: {Path(pdf_path).name}")
+            pdf_name = os.path.basename(pdf_path)
+            self._log(f"PDF encontrado: {pdf_name}")
             
-            # Extrai nome da pessoa
-            self._update_progress(5, "Detectando nome da pessoa...")
-            person_name = self.extract_person_name_from_pdf(pdf_path)
+            if self.check_pdf_signature and not self.is_pdf_file(pdf_path):
+                raise ValueError(f"Arquivo não é um PDF válido: {pdf_name}")
             
+            # PDF já processado com as mesmas regras dispensa toda a leitura do arquivo
+            cache_path = self._extraction_cache_path(pdf_path) if self.extraction_cache_enabled else None
+            cached = self._load_extraction_cache(cache_path) if cache_path else None
+            
+            if cached:
+                extraction = cached
+            else:
+                extraction = self._extract_pdf_data(pdf_path)
+                if cache_path:
+                    self._save_extraction_cache(cache_path, extraction)
+            
+            # Nome da pessoa, detectado na primeira página durante a extração
+            person_name = extraction['person_name']
             if person_name:
                 self._log(f"Nome detectado: {person_name}")
-                excel_path = self.copy_modelo_to_dados(pdf_path, person_name)
-                arquivo_final = f"DADOS/{self.normalize_filename(person_name)}.xlsm"
             else:
                 self._log("Nome não detectado - usando nome do PDF")
-                excel_path = self.copy_modelo_to_dados(pdf_path)
-                arquivo_final = f"DADOS/{Path(pdf_path).stem}.xlsm"
-            
-            self._log(f"Arquivo criado: {arquivo_final}")
-            
-            # Extrai dados do PDF
-            self._update_progress(10, "Extraindo texto do PDF...")
-            pages_text = self.extract_text_from_pdf(pdf_path)
             
-            # Categoriza páginas
-            self._update_progress(30, "Categorizando páginas...")
-            categorized_pages = self.filter_and_categorize_pages(pages_text)
-            
-            total_pages = len(pages_text)
-            folha_normal_count = len(categorized_pages['FOLHA NORMAL'])
-            salario_13_count = len(categorized_pages['13 SALARIO'])
+            total_pages = extraction['total_pages']
+            folha_normal_count = extraction['folha_normal_count']
+            salario_13_count = extraction['salario_13_count']
+            extracted_data = extraction['extracted_data']
             
             self._log(f"PDF processado: {total_pages} páginas totais")
             self._log(f"  - FOLHA NORMAL: {folha_normal_count} páginas")
             self._log(f"  - 13 SALARIO: {salario_13_count} páginas")
             
-            # Extrai dados de cada tipo de página
-            self._update_progress(40, "Extraindo dados das páginas...")
-            extracted_data = {
-                'FOLHA NORMAL': {},
-                '13 SALARIO': {}
-            }
-            
-            total_valid_pages = folha_normal_count + salario_13_count
-            current_page = 0
-            
-            for folha_type, pages in categorized_pages.items():
-                if not pages:
-                    continue
-                    
-                for i, page_text in enumerate(pages):
-                    current_page += 1
-                    
-                    # Progresso da extração de dados (40-70% do total)
-                    progress = int(40 + (current_page / total_valid_pages) * 30)
-                    self._update_progress(progress, f"Processando {folha_type} - página {i+1}")
-                    
-                    date_ref = self.extract_reference_date(page_text)
-                    if not date_ref:
-                        continue
-                    
-                    page_data = self.extract_data_from_page(page_text, folha_type)
-                    
-                    if page_data:
-                        extracted_data[folha_type][date_ref] = page_data
-            
-            # Atualiza Excel
+            # Atualiza Excel; a cópia do modelo só é criada quando há dados a gravar,
+            # para não deixar planilhas vazias em DADOS/ nem pagar o save à toa
             total_extracted = sum(len(periods) for periods in extracted_data.values())
             if total_extracted > 0:
-                self._update_progress(70, "Atualizando planilha Excel...")
+                if person_name:
+                    excel_path = self.copy_modelo_to_dados(pdf_path, person_name)
+                    arquivo_final = f"DADOS/{self.normalize_filename(person_name)}.xlsm"
+                else:
+                    excel_path = self.copy_modelo_to_dados(pdf_path)
+                    arquivo_final = f"DADOS/{Path(pdf_path).stem}.xlsm"
+                
+                self._log(f"Arquivo criado: {arquivo_final}")
+                
+                self._update_progress(self.PROGRESS_PAGES_END, "Atualizando planilha Excel...")
                 excel_results = self.update_excel_file(excel_path, extracted_data)
                 
                 self._update_progress(100, "Processamento concluído!")
@@ -28,6 +28,7 @@ MODELO_DIR=C:\\caminho\\para\\diretorio\\de\\trabalho
 Uso:
 python pdf_to_excel_updater.py                    # Abre seletor de arquivo
 python pdf_to_excel_updater.py arquivo.pdf        # Processa arquivo específico
+python pdf_to_excel_updater.py --batch pasta/     # Processa todos os PDFs da pasta
 
 Autor: Sistema de Extração Automatizada
 Data: 2025
@@ -37,9 +38,8 @@ import argparse
 import logging
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog, messagebox
 
 # Configuração de encoding para Windows
 if sys.platform == "win32":
@@ -60,47 +60,71 @@ except ImportError:
     print("Certifique-se de que o arquivo pdf_processor_core.py está na mesma pasta.")
     sys.exit(1)
 
-# Configuração de logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging é configurado em main(), depois de conhecer o nível pedido (-v)
 logger = logging.getLogger(__name__)
 
-def safe_print(message, fallback_message=None):
-    """Imprime mensagem com fallback para sistemas sem suporte a Unicode"""
+@lru_cache(maxsize=None)
+def _encoding_supports_unicode(encoding):
+    """Verifica uma única vez por encoding se o console consegue exibir os emojis usados na CLI"""
     try:
-        print(message)
-    except UnicodeEncodeError:
-        if fallback_message:
-            print(fallback_message)
-        else:
-            # Remove emojis e caracteres especiais
-            clean_message = message.encode('ascii', errors='ignore').decode('ascii')
-            print(clean_message)
+        "✅❌⚠️📄💰👤💾🔄•".encode(encoding)
+        return True
+    except (UnicodeEncodeError, LookupError):
+        return False
+
+def safe_print(message, fallback_message=None, file=None):
+    """Imprime mensagem com fallback para sistemas sem suporte a Unicode (file padrão: sys.stdout)"""
+    stream = sys.stdout if file is None else file
+    if _encoding_supports_unicode(getattr(stream, 'encoding', None) or 'utf-8'):
+        print(message, file=stream)
+    elif fallback_message:
+        print(fallback_message, file=stream)
+    else:
+        # Remove emojis e caracteres especiais
+        print(message.encode('ascii', errors='ignore').decode('ascii'), file=stream)
 
 class CLILogHandler:
     """Handler para logs da CLI que imprime diretamente no console"""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, stream=None):
         self.verbose = verbose
+        # Com stream definido (ex: sys.stderr no modo --json) os logs não vão para a saída padrão
+        self.stream = stream
     
     def log_callback(self, message):
         """Callback para receber logs do processador"""
-        if self.verbose:
-            safe_print(message)
-        elif not message.startswith('[DEBUG]'):
+        if not self.verbose:
+            if message.startswith('[DEBUG]'):
+                return
             # Remove prefixo [INFO], [WARNING], etc. para output mais limpo
-            clean_message = message
             if message.startswith('['):
-                clean_message = message.split('] ', 1)[-1] if '] ' in message else message
-            safe_print(clean_message)
+                sep = message.find('] ')
+                if sep >= 0:
+                    message = message[sep + 2:]
+        safe_print(message, file=self.stream)
 
 class PDFToExcelUpdater:
     """Wrapper da CLI para PDFProcessorCore - para compatibilidade"""
     
-    def __init__(self, verbose=False):
-        """Inicializa o updater usando PDFProcessorCore"""
+    def __init__(self, verbose=False, pdf_backend='pdfplumber', use_cache=True, check_pdf_signature=True,
+                 log_stream=None, pages=None):
+        """
+        Inicializa o updater usando PDFProcessorCore
+        
+        Args:
+            verbose: Mostra logs detalhados
+            pdf_backend: Biblioteca de extração de texto ('pdfplumber', 'pymupdf' ou 'pypdfium2')
+            use_cache: Reaproveita os dados de um PDF já processado (DADOS/.cache)
+            check_pdf_signature: Rejeita de imediato arquivos sem cabeçalho %PDF-
+            log_stream: Destino dos logs (padrão: saída padrão)
+            pages: Páginas a extrair, ex: "1-3,7,10-12" (padrão: todas)
+        
+        Raises:
+            ValueError: Se a seleção de páginas for inválida
+        """
         
         # Cria handler de logs
-        self.log_handler = CLILogHandler(verbose)
+        self.log_handler = CLILogHandler(verbose, log_stream)
         
         # Inicializa o processador core
         self.processor = PDFProcessorCore(
@@ -108,6 +132,16 @@ class PDFToExcelUpdater:
             log_callback=self.log_handler.log_callback
         )
         
+        # A CLI processa um PDF por vez: extrai as páginas usando todos os núcleos
+        self.processor.max_page_workers = None
+        self.processor.pdf_backend = pdf_backend
+        self.processor.extraction_cache_enabled = use_cache
+        self.processor.check_pdf_signature = check_pdf_signature
+        # Sem -v as mensagens DEBUG seriam descartadas pelo handler: nem chegam a ser enviadas
+        self.processor.debug_logging = verbose
+        if pages:
+            self.processor.page_selection = self.processor.parse_page_selection(pages)
+        
         # Para compatibilidade com interface antiga
         self.preferred_sheet = None
 
@@ -117,6 +151,10 @@ class PDFToExcelUpdater:
 
     def select_pdf_file(self):
         """Abre diálogo para seleção de arquivo PDF no diretório de trabalho"""
+        # Tkinter só é carregado quando o seletor é realmente necessário
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+        
         try:
             # Carrega configuração primeiro
             self.processor.load_env_config()
@@ -127,9 +165,7 @@ class PDFToExcelUpdater:
             root.attributes('-topmost', True)  # Mantém diálogo na frente
             
             # Verifica se há PDFs disponíveis
-            pdf_files = self.processor.get_pdf_files_in_trabalho_dir()
-            
-            if not pdf_files:
+            if not self.processor.has_pdf_files_in_trabalho_dir():
                 messagebox.showwarning(
                     "Nenhum PDF encontrado", 
                     f"Nenhum arquivo PDF encontrado no diretório de trabalho:\n{self.processor.trabalho_dir}"
@@ -168,20 +204,8 @@ class PDFToExcelUpdater:
         if self.preferred_sheet:
             self.processor.preferred_sheet = self.preferred_sheet
         
-        # Processa usando o core
-        results = self.processor.process_pdf(pdf_filename)
-        
-        if not results['success']:
-            raise ValueError(results['error'])
-        
-        # Retorna no formato esperado pela CLI antiga (para compatibilidade)
-        extracted_data = {
-            'FOLHA NORMAL': {},
-            '13 SALARIO': {}
-        }
-        
-        # Simula estrutura antiga se necessário
-        return extracted_data, results['excel_path'], results['person_name']
+        # Processa usando o core e devolve o dicionário de resultados diretamente
+        return self.processor.process_pdf(pdf_filename)
 
 def print_results_summary(results):
     """Imprime resumo dos resultados de forma organizada"""
@@ -190,32 +214,35 @@ def print_results_summary(results):
         safe_print(f"❌ ERRO: {results['error']}", f"ERRO: {results['error']}")
         return
     
+    # O resumo é montado por completo e impresso de uma só vez: (mensagem, alternativa sem Unicode)
+    lines = []
+    
     # Resultados básicos
     total = results['total_extracted']
     normal = results['folha_normal_periods']
     salario_13 = results['salario_13_periods']
     
-    safe_print(f"\n✅ Processamento concluído: {total} períodos processados", 
-               f"\nOK: Processamento concluido: {total} periodos processados")
+    lines.append((f"\n✅ Processamento concluído: {total} períodos processados", 
+                  f"\nOK: Processamento concluido: {total} periodos processados"))
     
     if normal > 0:
-        safe_print(f"   📄 FOLHA NORMAL: {normal} períodos", 
-                   f"   FOLHA NORMAL: {normal} periodos")
+        lines.append((f"   📄 FOLHA NORMAL: {normal} períodos", 
+                      f"   FOLHA NORMAL: {normal} periodos"))
     if salario_13 > 0:
-        safe_print(f"   💰 13 SALÁRIO: {salario_13} períodos", 
-                   f"   13 SALARIO: {salario_13} periodos")
+        lines.append((f"   💰 13 SALÁRIO: {salario_13} períodos", 
+                      f"   13 SALARIO: {salario_13} periodos"))
     
     # Nome detectado
     if results.get('person_name'):
-        safe_print(f"\n👤 Nome detectado: {results['person_name']}", 
-                   f"\nNome detectado: {results['person_name']}")
+        lines.append((f"\n👤 Nome detectado: {results['person_name']}", 
+                      f"\nNome detectado: {results['person_name']}"))
     else:
-        safe_print(f"\n📄 Nome não detectado - usando nome do PDF", 
-                   f"\nNome nao detectado - usando nome do PDF")
+        lines.append((f"\n📄 Nome não detectado - usando nome do PDF", 
+                      f"\nNome nao detectado - usando nome do PDF"))
     
     # Arquivo criado
-    safe_print(f"\n💾 Arquivo criado: {results['arquivo_final']}", 
-               f"\nArquivo criado: {results['arquivo_final']}")
+    lines.append((f"\n💾 Arquivo criado: {results['arquivo_final']}", 
+                  f"\nArquivo criado: {results['arquivo_final']}"))
     
     # Estatísticas detalhadas se houver falhas
     if results.get('failed_periods'):
@@ -224,248 +251,94 @@ def print_results_summary(results):
         total_periods = results['total_periods']
         
         if failed_count > 0:
-            safe_print(f"\n⚠️  Atenção: {failed_count} períodos falharam:", 
-                       f"\nAtencao: {failed_count} periodos falharam:")
+            lines.append((f"\n⚠️  Atenção: {failed_count} períodos falharam:", 
+                          f"\nAtencao: {failed_count} periodos falharam:"))
             for failed in results['failed_periods'][:3]:
-                safe_print(f"   • {failed}", f"   - {failed}")
+                lines.append((f"   • {failed}", f"   - {failed}"))
             if failed_count > 3:
-                safe_print(f"   • ... e mais {failed_count - 3} períodos", 
-                           f"   - ... e mais {failed_count - 3} periodos")
+                lines.append((f"   • ... e mais {failed_count - 3} períodos", 
+                              f"   - ... e mais {failed_count - 3} periodos"))
+    
+    safe_print('\n'.join(message for message, _ in lines),
+               '\n'.join(fallback for _, fallback in lines))
 
-def main():
-    """Função principal da aplicação"""
-    parser = argparse.ArgumentParser(
-        description='PDF para Excel Updater v3.2 - CLI usando PDFProcessorCore',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Exemplos de uso:
-  python pdf_to_excel_updater.py                    # Abre seletor de arquivo
-  python pdf_to_excel_updater.py arquivo.pdf        # Processa arquivo específico
-  python pdf_to_excel_updater.py arquivo.pdf -v     # Modo verboso
-  python pdf_to_excel_updater.py arquivo.pdf -s "PLANILHA"  # Planilha específica
+def print_json(data):
+    """Imprime um objeto como uma linha JSON (formato único de todas as saídas --json)"""
+    import json
+    print(json.dumps(data, ensure_ascii=False))
 
-Configuração:
-  Configure MODELO_DIR no arquivo .env apontando para o diretório que contém MODELO.xlsm
-        """
-    )
-    
-    parser.add_argument(
-        'pdf_filename', 
-        nargs='?', 
-        help='Nome do arquivo PDF (opcional - abrirá diálogo se não fornecido)'
-    )
-    parser.add_argument(
-        '-s', '--sheet', 
-        help='Nome da planilha específica (padrão: "LEVANTAMENTO DADOS")'
-    )
-    parser.add_argument(
-        '-v', '--verbose', 
-        action='store_true', 
-        help='Modo verboso (mostra logs detalhados)'
-    )
-    
-    args = parser.parse_args()
-    
-    # Configura nível de log baseado no verbose
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+def print_results_json(pdf_filename, results):
+    """Imprime o resultado como uma linha JSON para consumo por scripts"""
+    if results['success']:
+        summary = {
+            'status': 'ok',
+            'pdf': pdf_filename,
+            'excel': results['arquivo_final'],
+            'person_name': results.get('person_name'),
+            'periods': results['total_extracted'],
+            'folha_normal_periods': results['folha_normal_periods'],
+            'salario_13_periods': results['salario_13_periods'],
+            'success_periods': results.get('success_periods'),
+            'failed_periods': results.get('failed_periods', []),
+            'attention_periods': len(results.get('attention_periods', []))
+        }
     else:
-        logging.getLogger().setLevel(logging.INFO)
+        summary = {'status': 'error', 'pdf': pdf_filename, 'message': results['error']}
     
-    try:
-        # Cria updater
-        updater = PDFToExcelUpdater(verbose=args.verbose)
-        
-        # Configura planilha se especificada
-        if args.sheet:
-            updater.preferred_sheet = args.sheet
-        
-        # Determina qual PDF processar
-        pdf_filename = args.pdf_filename
-        
-        if not pdf_filename:
-            # Se não foi fornecido PDF, abre diálogo de seleção
-            if not args.verbose:
-                safe_print("Abrindo seletor de arquivo...")
-            
-            pdf_filename = updater.select_pdf_file()
-            
-            if not pdf_filename:
-                safe_print("❌ CANCELADO: Nenhum arquivo selecionado", 
-                           "CANCELADO: Nenhum arquivo selecionado")
-                return 0
-        
-        if not args.verbose:
-            safe_print(f"🔄 Processando: {pdf_filename}", 
-                       f"Processando: {pdf_filename}")
-        
-        # Processa PDF usando o core
-        results = updater.processor.process_pdf(pdf_filename)
-        
-        # Imprime resultados
-        print_results_summary(results)
-        
-        return 0 if results['success'] else 1
-        
-    except ValueError as e:
-        safe_print(f"❌ ERRO: {e}", f"ERRO: {e}")
-        return 1
-    except Exception as e:
-        safe_print(f"❌ ERRO: Erro inesperado: {e}", f"ERRO: Erro inesperado: {e}")
-        if args.verbose:
-            raise
-        return 1
+    print_json(summary)
 
-if __name__ == "__main__":
-    sys.exit(main())
+def print_error(message, as_json=False):
+    """Imprime erro da CLI em texto ou JSON"""
+    if as_json:
+        print_json({'status': 'error', 'message': message})
+    else:
+        safe_print(f"❌ ERRO: {message}", f"ERRO: {message}")
 
-class CLILogHandler:
-    """Handler para logs da CLI que imprime diretamente no console"""
+def find_batch_pdfs(batch_input):
+    """Lista os PDFs de uma pasta ou de um padrão glob, com caminhos absolutos"""
+    import glob
     
-    def __init__(self, verbose=False):
-        self.verbose = verbose
+    batch_path = Path(batch_input)
+    if batch_path.is_dir():
+        # normcase segue a regra do glob: sem distinção de maiúsculas só no Windows
+        candidates = (str(path) for path in batch_path.iterdir()
+                      if os.path.normcase(path.name).endswith('.pdf'))
+    else:
+        candidates = glob.glob(batch_input)
     
-    def log_callback(self, message):
-        """Callback para receber logs do processador"""
-        if self.verbose:
-            print(message)
-        elif not message.startswith('[DEBUG]'):
-            # Remove prefixo [INFO], [WARNING], etc. para output mais limpo
-            clean_message = message
-            if message.startswith('['):
-                clean_message = message.split('] ', 1)[-1] if '] ' in message else message
-            print(clean_message)
+    # Caminho absoluto: o core só procura no diretório de trabalho nomes sem pasta
+    return sorted(os.path.abspath(path) for path in candidates if os.path.isfile(path))
 
-class PDFToExcelUpdater:
-    """Wrapper da CLI para PDFProcessorCore - para compatibilidade"""
+def process_batch(updater, args):
+    """Processa vários PDFs no mesmo processo, reaproveitando o updater já inicializado"""
+    pdf_files = find_batch_pdfs(args.batch)
+    if not pdf_files:
+        print_error(f"Nenhum PDF encontrado em: {args.batch}", args.json)
+        return 1
     
-    def __init__(self, verbose=False):
-        """Inicializa o updater usando PDFProcessorCore"""
-        
-        # Cria handler de logs
-        self.log_handler = CLILogHandler(verbose)
-        
-        # Inicializa o processador core
-        self.processor = PDFProcessorCore(
-            progress_callback=None,  # CLI não usa progress bar
-            log_callback=self.log_handler.log_callback
-        )
-        
-        # Para compatibilidade com interface antiga
-        self.preferred_sheet = None
-
-    def load_env_config(self):
-        """Carrega configurações do arquivo .env"""
-        return self.processor.load_env_config()
-
-    def select_pdf_file(self):
-        """Abre diálogo para seleção de arquivo PDF no diretório de trabalho"""
-        try:
-            # Carrega configuração primeiro
-            self.processor.load_env_config()
-            
-            # Cria janela invisível
-            root = tk.Tk()
-            root.withdraw()  # Esconde a janela principal
-            root.attributes('-topmost', True)  # Mantém diálogo na frente
-            
-            # Verifica se há PDFs disponíveis
-            pdf_files = self.processor.get_pdf_files_in_trabalho_dir()
-            
-            if not pdf_files:
-                messagebox.showwarning(
-                    "Nenhum PDF encontrado", 
-                    f"Nenhum arquivo PDF encontrado no diretório de trabalho:\n{self.processor.trabalho_dir}"
-                )
-                root.destroy()
-                return None
-            
-            # Abre diálogo de seleção
-            selected_file = filedialog.askopenfilename(
-                title="Selecione o arquivo PDF para processar",
-                initialdir=self.processor.trabalho_dir,
-                filetypes=[
-                    ("Arquivos PDF", "*.pdf"),
-                    ("Todos os arquivos", "*.*")
-                ]
-            )
-            
-            root.destroy()
-            
-            if selected_file:
-                # Retorna apenas o nome do arquivo (sem caminho)
-                return Path(selected_file).name
-            else:
-                return None
-                
-        except Exception as e:
-            if 'root' in locals():
-                root.destroy()
-            logger.error(f"Erro ao abrir diálogo de seleção: {e}")
-            return None
-
-    def process_pdf(self, pdf_filename: str):
-        """Processa PDF usando PDFProcessorCore"""
-        
-        # Configura planilha preferida se especificada
-        if self.preferred_sheet:
-            self.processor.preferred_sheet = self.preferred_sheet
-        
-        # Processa usando o core
-        results = self.processor.process_pdf(pdf_filename)
+    total_files = len(pdf_files)
+    failures = 0
+    
+    for index, pdf_file in enumerate(pdf_files, start=1):
+        if not args.verbose and not args.json:
+            pdf_name = os.path.basename(pdf_file)
+            safe_print(f"\n🔄 [{index}/{total_files}] Processando: {pdf_name}", 
+                       f"\n[{index}/{total_files}] Processando: {pdf_name}")
         
+        results = updater.process_pdf(pdf_file)
         if not results['success']:
-            raise ValueError(results['error'])
+            failures += 1
         
-        # Retorna no formato esperado pela CLI antiga (para compatibilidade)
-        extracted_data = {
-            'FOLHA NORMAL': {},
-            '13 SALARIO': {}
-        }
-        
-        # Simula estrutura antiga se necessário
-        return extracted_data, results['excel_path'], results['person_name']
-
-def print_results_summary(results):
-    """Imprime resumo dos resultados de forma organizada"""
-    
-    if not results['success']:
-        print(f"❌ ERRO: {results['error']}")
-        return
-    
-    # Resultados básicos
-    total = results['total_extracted']
-    normal = results['folha_normal_periods']
-    salario_13 = results['salario_13_periods']
-    
-    print(f"\n✅ Processamento concluído: {total} períodos processados")
-    
-    if normal > 0:
-        print(f"   📄 FOLHA NORMAL: {normal} períodos")
-    if salario_13 > 0:
-        print(f"   💰 13 SALÁRIO: {salario_13} períodos")
-    
-    # Nome detectado
-    if results.get('person_name'):
-        print(f"\n👤 Nome detectado: {results['person_name']}")
-    else:
-        print(f"\n📄 Nome não detectado - usando nome do PDF")
+        if args.json:
+            print_results_json(pdf_file, results)
+        else:
+            print_results_summary(results)
     
-    # Arquivo criado
-    print(f"\n💾 Arquivo criado: {results['arquivo_final']}")
+    if not args.json:
+        safe_print(f"\n📦 Lote concluído: {total_files - failures}/{total_files} PDFs processados com sucesso", 
+                   f"\nLote concluido: {total_files - failures}/{total_files} PDFs processados com sucesso")
     
-    # Estatísticas detalhadas se houver falhas
-    if results.get('failed_periods'):
-        failed_count = len(results['failed_periods'])
-        success_count = results['success_periods']
-        total_periods = results['total_periods']
-        
-        if failed_count > 0:
-            print(f"\n⚠️  Atenção: {failed_count} períodos falharam:")
-            for failed in results['failed_periods'][:3]:
-                print(f"   • {failed}")
-            if failed_count > 3:
-                print(f"   • ... e mais {failed_count - 3} períodos")
+    return 0 if failures == 0 else 1
 
 def main():
     """Função principal da aplicação"""
@@ -478,6 +351,12 @@ Exemplos de uso:
   python pdf_to_excel_updater.py arquivo.pdf        # Processa arquivo específico
   python pdf_to_excel_updater.py arquivo.pdf -v     # Modo verboso
   python pdf_to_excel_updater.py arquivo.pdf -s "PLANILHA"  # Planilha específica
+  python pdf_to_excel_updater.py arquivo.pdf --parser pymupdf  # Extração mais rápida (PyMuPDF)
+  python pdf_to_excel_updater.py arquivo.pdf --parser pypdfium2  # Extração mais rápida (PDFium)
+  python pdf_to_excel_updater.py arquivo.pdf --pages 1-3,7  # Lê apenas as páginas indicadas
+  python pdf_to_excel_updater.py arquivo.pdf --no-cache  # Relê o PDF mesmo já processado
+  python pdf_to_excel_updater.py arquivo.pdf --json  # Resultado em JSON para scripts
+  python pdf_to_excel_updater.py --batch pdfs/      # Todos os PDFs da pasta em lote
 
 Configuração:
   Configure MODELO_DIR no arquivo .env apontando para o diretório que contém MODELO.xlsm
@@ -493,6 +372,37 @@ Configuração:
         '-s', '--sheet', 
         help='Nome da planilha específica (padrão: "LEVANTAMENTO DADOS")'
     )
+    parser.add_argument(
+        '--parser',
+        choices=['pdfplumber', 'pymupdf', 'pypdfium2'],
+        default='pdfplumber',
+        help='Biblioteca de extração de texto (padrão: pdfplumber; pymupdf e pypdfium2 são mais rápidas)'
+    )
+    parser.add_argument(
+        '--pages',
+        metavar='PAGINAS',
+        help='Extrai apenas as páginas indicadas, numeradas a partir de 1 (ex: "1-3,7,10-12")'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignora o cache de PDFs já processados e lê o PDF novamente'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Processa o arquivo mesmo sem o cabeçalho %%PDF- (PDFs malformados)'
+    )
+    parser.add_argument(
+        '--batch',
+        metavar='PASTA_OU_PADRAO',
+        help='Processa no mesmo processo todos os PDFs de uma pasta ou padrão (ex: "pdfs/*.pdf")'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Imprime o resultado como JSON na saída padrão (logs vão para a saída de erro)'
+    )
     parser.add_argument(
         '-v', '--verbose', 
         action='store_true', 
@@ -501,53 +411,97 @@ Configuração:
     
     args = parser.parse_args()
     
-    # Configura nível de log baseado no verbose
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-    else:
-        logging.getLogger().setLevel(logging.INFO)
+    if args.batch and args.pdf_filename:
+        parser.error("informe o arquivo PDF ou --batch, não ambos")
+    
+    # Configura logging uma única vez, com o nível baseado no verbose
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        force=True
+    )
+    # O pdfminer (usado pelo pdfplumber) gera várias mensagens DEBUG por página
+    logging.getLogger('pdfminer').setLevel(logging.WARNING)
     
     try:
         # Cria updater
-        updater = PDFToExcelUpdater(verbose=args.verbose)
+        updater = PDFToExcelUpdater(
+            verbose=args.verbose,
+            pdf_backend=args.parser,
+            use_cache=not args.no_cache,
+            check_pdf_signature=not args.force,
+            log_stream=sys.stderr if args.json else None,
+            pages=args.pages
+        )
         
         # Configura planilha se especificada
         if args.sheet:
             updater.preferred_sheet = args.sheet
         
+        if args.batch:
+            return process_batch(updater, args)
+        
         # Determina qual PDF processar
         pdf_filename = args.pdf_filename
         
         if not pdf_filename:
             # Se não foi fornecido PDF, abre diálogo de seleção
-            if not args.verbose:
-                print("Abrindo seletor de arquivo...")
+            if not args.verbose and not args.json:
+                safe_print("Abrindo seletor de arquivo...")
             
             pdf_filename = updater.select_pdf_file()
             
             if not pdf_filename:
-                print("❌ CANCELADO: Nenhum arquivo selecionado")
+                if args.json:
+                    print_json({'status': 'cancelled'})
+                else:
+                    safe_print("❌ CANCELADO: Nenhum arquivo selecionado", 
+                               "CANCELADO: Nenhum arquivo selecionado")
                 return 0
         
-        if not args.verbose:
-            print(f"🔄 Processando: {pdf_filename}")
+        if not args.verbose and not args.json:
+            safe_print(f"🔄 Processando: {pdf_filename}", 
+                       f"Processando: {pdf_filename}")
         
         # Processa PDF usando o core
-        results = updater.processor.process_pdf(pdf_filename)
+        results = updater.process_pdf(pdf_filename)
         
         # Imprime resultados
-        print_results_summary(results)
+        if args.json:
+            print_results_json(pdf_filename, results)
+        else:
+            print_results_summary(results)
         
         return 0 if results['success'] else 1
         
     except ValueError as e:
-        print(f"❌ ERRO: {e}")
+        print_error(str(e), args.json)
+        return 1
+    except OSError as e:
+        # Arquivo inexistente, sem permissão, disco cheio...
+        print_error(f"Erro de arquivo: {e}", args.json)
         return 1
+    except KeyboardInterrupt:
+        print_error("Interrompido pelo usuário", args.json)
+        return 130
     except Exception as e:
-        print(f"❌ ERRO: Erro inesperado: {e}")
+        print_error(f"Erro inesperado: {e}", args.json)
         if args.verbose:
-            raise
+            logger.exception("Detalhes do erro inesperado")
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    # Necessário para os processos de extração no executável gerado pelo PyInstaller
+    # (fora do executável freeze_support não faz nada - evita importar multiprocessing)
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    exit_code = main()
+    if os.environ.get('PDF2XLSX_NORMAL_EXIT'):
+        # Saída normal (atexit, finalizadores) - necessária para ferramentas como coverage.py
+        sys.exit(exit_code)
+    # Os arquivos já foram gravados e fechados: encerra sem a limpeza do interpretador,
+    # que custa tempo em execuções repetidas por scripts
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
@@ -114,6 +114,21 @@ class FichaFinanceiraProcessor:
     }
 
     NUMBER_PATTERN = re.compile(r"^\d{1,3}(?:\.\d{3})*,\d+$|^\d+(?:,\d+)?$")
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    NAME_BEFORE_NUMBER_PATTERN = re.compile(r"([A-Za-zÀ-ÿ'`\s]+?)\s+\d")
+    NAME_PATTERNS = (
+        re.compile(r"Nome\s*[:\-]?\s*([A-Za-zÀ-ÿ'`\s]+)"),
+        re.compile(r"NOME\s*[:\-]?\s*([A-Za-zÀ-ÿ'`\s]+)"),
+    )
+    NAME_FALLBACK_PATTERNS = (
+        re.compile(r"Nome\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+)"),
+        re.compile(r"NOME\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+)"),
+    )
+    NAME_TRAILING_NUMBER_PATTERN = re.compile(r"\s+\d.*$")
+    NAME_INVALID_CHARS_PATTERN = re.compile(r"[^A-Za-zÀ-ÿ'`\s-]")
+    NAME_LETTER_PATTERN = re.compile(r"[A-Za-zÀ-ÿ]")
+    SLUG_INVALID_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9_\-]")
 
     CARTOES_TIME_MODE_DECIMAL = "decimal"
     CARTOES_TIME_MODE_MINUTES = "minutes"
@@ -630,7 +645,7 @@ class FichaFinanceiraProcessor:
     def _normalize_code_text(self, text: str) -> str:
         cleaned = unicodedata.normalize("NFKD", text or "").replace("\xa0", " ")
         cleaned = cleaned.replace("‑", "-").replace("–", "-")
-        return re.sub(r"\s+", "", cleaned)
+        return self.WHITESPACE_PATTERN.sub("", cleaned)
 
     def _extract_values_from_row(
         self, row_words: List[Dict[str, object]], block: MonthBlock, column: int
@@ -862,31 +877,21 @@ class FichaFinanceiraProcessor:
                     cleaned = self._clean_person_name(candidate)
                     if cleaned:
                         return cleaned
-                    match = re.match(r"([A-Za-zÀ-ÿ'`\s]+?)\s+\d", candidate)
+                    match = self.NAME_BEFORE_NUMBER_PATTERN.match(candidate)
                     if match:
                         return match.group(1).strip()
                     return candidate.split("  ")[0].strip()
 
-        name_patterns = [
-            r"Nome\s*[:\-]?\s*([A-Za-zÀ-ÿ'`\s]+)",
-            r"NOME\s*[:\-]?\s*([A-Za-zÀ-ÿ'`\s]+)",
-        ]
-
         for line in lines:
-            for pattern in name_patterns:
-                match = re.search(pattern, line)
+            for pattern in self.NAME_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     cleaned = self._clean_person_name(match.group(1))
                     if cleaned:
                         return cleaned
 
-        fallback_patterns = [
-            r"Nome\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+)",
-            r"NOME\s*:\s*([A-ZÁÇÃÂÊÔÉÍÓÚÀÈÌÒÙ\s]+)",
-        ]
-
-        for pattern in fallback_patterns:
-            match = re.search(pattern, text)
+        for pattern in self.NAME_FALLBACK_PATTERNS:
+            match = pattern.search(text)
             if match:
                 cleaned = self._clean_person_name(match.group(1))
                 if cleaned:
@@ -899,14 +904,14 @@ class FichaFinanceiraProcessor:
             return None
 
         trimmed = raw_name.strip()
-        trimmed = re.sub(r"\s+\d.*$", "", trimmed)
-        trimmed = re.sub(r"[^A-Za-zÀ-ÿ'`\s-]", " ", trimmed)
-        cleaned = re.sub(r"\s+", " ", trimmed).strip()
+        trimmed = self.NAME_TRAILING_NUMBER_PATTERN.sub("", trimmed)
+        trimmed = self.NAME_INVALID_CHARS_PATTERN.sub(" ", trimmed)
+        cleaned = self.WHITESPACE_PATTERN.sub(" ", trimmed).strip()
 
         if len(cleaned) < 3:
             return None
 
-        if not re.search(r"[A-Za-zÀ-ÿ]", cleaned):
+        if not self.NAME_LETTER_PATTERN.search(cleaned):
             return None
 
         return cleaned
@@ -1149,7 +1154,7 @@ class FichaFinanceiraProcessor:
             ch for ch in normalized if not unicodedata.combining(ch)
         )
         ascii_text = ascii_text.replace(" ", "_")
-        ascii_text = re.sub(r"[^A-Za-z0-9_\-]", "", ascii_text)
+        ascii_text = self.SLUG_INVALID_CHARS_PATTERN.sub("", ascii_text)
         return ascii_text or "resultado"
 
     def _format_decimal(self, value: Decimal) -> str:
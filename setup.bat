@@ -66,13 +66,6 @@ if %errorlevel% neq 0 (
 echo.
 echo [4/7] Instalando dependencias CORE...
 
-echo   - Instalando pandas...
-pip install "pandas>=1.5.0" --quiet
-if %errorlevel% neq 0 (
-    echo ERRO: Falha ao instalar pandas
-    goto :error
-)
-
 echo   - Instalando openpyxl...
 pip install "openpyxl>=3.0.0" --quiet
 if %errorlevel% neq 0 (
@@ -210,12 +203,6 @@ echo ==========================================
 echo.
 
 echo Testando dependencias CORE...
-python -c "import pandas; print('  pandas:', pandas.__version__)" 2>nul
-if %errorlevel% neq 0 (
-    echo ERRO: pandas nao pode ser importado
-    goto :error
-)
-
 python -c "import openpyxl; print('  openpyxl:', openpyxl.__version__)" 2>nul
 if %errorlevel% neq 0 (
     echo ERRO: openpyxl nao pode ser importado
@@ -315,7 +302,7 @@ echo  3. Certifique-se que Python e 3.8+ ^(requerido para PyQt6^)
 echo  4. Tente instalar manualmente:
 echo     pip install -r requirements.txt
 echo  5. Para apenas linha de comando ^(sem GUI^):
-echo     pip install pandas openpyxl pdfplumber python-dotenv
+echo     pip install openpyxl pdfplumber python-dotenv
 echo.
 echo Se o problema persistir:
 echo  - Verifique se Python e pip estao atualizados
@@ -0,0 +1,167 @@
+from datetime import datetime
+from pathlib import Path
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+
+from pdf_processor_core import PDFProcessorCore
+
+
+class ExtractLastTwoNumbersTest(unittest.TestCase):
+    def test_parses_brazilian_numbers_and_hours(self) -> None:
+        processor = PDFProcessorCore()
+
+        self.assertEqual(
+            (10.5, 1234.56),
+            processor.extract_last_two_numbers("01003601 PREMIO PROD. MENSAL 10,50 1.234,56"),
+        )
+        self.assertEqual(
+            ("06,34", 500.0),
+            processor.extract_last_two_numbers("01007301 HORAS EXT.100%-180 06:34 500,00"),
+        )
+        self.assertEqual((None, 12.0), processor.extract_last_two_numbers("TOTAL 12"))
+        self.assertEqual((None, None), processor.extract_last_two_numbers("SEM NUMEROS"))
+
+    def test_rejects_ambiguous_separators(self) -> None:
+        processor = PDFProcessorCore()
+
+        self.assertEqual((None, None), processor.extract_last_two_numbers("X 1,2,3"))
+        self.assertEqual((None, 1234567.89), processor.extract_last_two_numbers("X 1,234,567.89"))
+
+
+class PeriodIndexTest(unittest.TestCase):
+    def _build_worksheet(self):
+        worksheet = Workbook().active
+        worksheet["A2"] = " jan/20 "
+        worksheet["A3"] = datetime(2020, 2, 1)
+        worksheet["A4"] = 43891  # Serial do Excel para 01/03/2020
+        worksheet["A67"] = "dez/20"
+        return worksheet
+
+    def test_index_matches_linear_search(self) -> None:
+        processor = PDFProcessorCore()
+        worksheet = self._build_worksheet()
+        period_index = processor.build_period_index(worksheet)
+
+        for folha_type in ("FOLHA NORMAL", "13 SALARIO"):
+            for month in range(1, 13):
+                self.assertEqual(
+                    processor.find_row_for_period(worksheet, month, 2020, folha_type),
+                    processor.lookup_period_row(period_index, month, 2020, folha_type),
+                )
+
+    def test_index_respects_folha_sections(self) -> None:
+        processor = PDFProcessorCore()
+        period_index = processor.build_period_index(self._build_worksheet())
+
+        self.assertEqual(2, processor.lookup_period_row(period_index, 1, 2020, "FOLHA NORMAL"))
+        self.assertEqual(3, processor.lookup_period_row(period_index, 2, 2020, "FOLHA NORMAL"))
+        self.assertEqual(4, processor.lookup_period_row(period_index, 3, 2020, "FOLHA NORMAL"))
+        self.assertIsNone(processor.lookup_period_row(period_index, 12, 2020, "FOLHA NORMAL"))
+        self.assertEqual(67, processor.lookup_period_row(period_index, 12, 2020, "13 SALARIO"))
+
+
+class ExtractionCacheTest(unittest.TestCase):
+    def test_round_trip_preserves_period_keys(self) -> None:
+        processor = PDFProcessorCore()
+        extraction = {
+            "person_name": "MARIA DA SILVA",
+            "total_pages": 3,
+            "folha_normal_count": 2,
+            "salario_13_count": 1,
+            "extracted_data": {
+                "FOLHA NORMAL": {(1, 2020): {"X": 12.5, "Y": "06,34"}},
+                "13 SALARIO": {(12, 2020): {"B": 1500.0}},
+            },
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / ".cache" / "teste.json"
+            processor._save_extraction_cache(cache_path, extraction)
+
+            self.assertEqual(extraction, processor._load_extraction_cache(cache_path))
+
+    def test_missing_or_invalid_cache_is_ignored(self) -> None:
+        processor = PDFProcessorCore()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "teste.json"
+            self.assertIsNone(processor._load_extraction_cache(cache_path))
+
+            cache_path.write_text("{", encoding="utf-8")
+            self.assertIsNone(processor._load_extraction_cache(cache_path))
+
+            cache_path.write_text('{"person_name": "MARIA"}', encoding="utf-8")
+            self.assertIsNone(processor._load_extraction_cache(cache_path))
+
+    def test_cache_key_depends_on_text_extraction_options(self) -> None:
+        processor = PDFProcessorCore()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor.trabalho_dir = temp_dir
+            pdf_path = Path(temp_dir) / "teste.pdf"
+            pdf_path.write_bytes(b"%PDF-1.7\n")
+
+            default_path = processor._extraction_cache_path(str(pdf_path))
+            processor.text_extraction_options = {**processor.text_extraction_options, "x_tolerance": 2}
+
+            self.assertNotEqual(default_path, processor._extraction_cache_path(str(pdf_path)))
+
+    def test_save_prunes_older_entries_of_same_pdf(self) -> None:
+        processor = PDFProcessorCore()
+        extraction = {
+            "person_name": "MARIA DA SILVA",
+            "total_pages": 1,
+            "folha_normal_count": 1,
+            "salario_13_count": 0,
+            "extracted_data": {"FOLHA NORMAL": {}, "13 SALARIO": {}},
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir)
+            old_entry = cache_dir / "abc-pdfplumber-111111111111-v0.json"
+            other_pdf = cache_dir / "def-pdfplumber-111111111111-v1.json"
+            old_entry.write_text("{}", encoding="utf-8")
+            other_pdf.write_text("{}", encoding="utf-8")
+
+            cache_path = cache_dir / "abc-pdfplumber-222222222222-v1.json"
+            processor._save_extraction_cache(cache_path, extraction)
+
+            self.assertTrue(cache_path.exists())
+            self.assertFalse(old_entry.exists())
+            self.assertTrue(other_pdf.exists())
+
+
+class PdfSignatureTest(unittest.TestCase):
+    def test_detects_pdf_header(self) -> None:
+        processor = PDFProcessorCore()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "valido.pdf"
+            pdf_path.write_bytes(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+            fake_path = Path(temp_dir) / "falso.pdf"
+            fake_path.write_bytes(b"PK\x03\x04 planilha renomeada")
+
+            self.assertTrue(processor.is_pdf_file(str(pdf_path)))
+            self.assertFalse(processor.is_pdf_file(str(fake_path)))
+            self.assertFalse(processor.is_pdf_file(str(Path(temp_dir) / "inexistente.pdf")))
+
+
+class PageSelectionTest(unittest.TestCase):
+    def test_parses_ranges_into_sorted_zero_based_indexes(self) -> None:
+        processor = PDFProcessorCore()
+
+        self.assertEqual([0, 1, 2, 6, 9, 10, 11], processor.parse_page_selection("10-12, 1-3,7,3"))
+        self.assertEqual([4], processor.parse_page_selection("5"))
+
+    def test_rejects_invalid_selection(self) -> None:
+        processor = PDFProcessorCore()
+
+        for spec in ("", "0", "3-1", "a-2", "1,,2"):
+            with self.assertRaises(ValueError):
+                processor.parse_page_selection(spec)
+
+
+if __name__ == "__main__":
+    unittest.main()